@@ -30,8 +30,16 @@ class DownloadWorker(QThread):
         self._successful = 0
         self._failed = 0
     
-    def _download_single_chapter(self, chapter_dict, manga, total):
-        """Download a single chapter. Called from thread pool."""
+    def _download_lane(self, lane_key, chapter_dicts, manga, total):
+        """Download a run of consecutive chapters in order on one browser tab. Called from thread pool."""
+        from src.core.downloader import is_cancelled
+        for chapter_dict in chapter_dicts:
+            if is_cancelled():
+                break
+            self._download_single_chapter(chapter_dict, manga, total, lane_key)
+    
+    def _download_single_chapter(self, chapter_dict, manga, total, lane_key=None):
+        """Download a single chapter."""
         try:
             from src.api.comix import ComixAPI
             from src.core.downloader import ChapterDownloader
@@ -56,7 +64,8 @@ class DownloadWorker(QThread):
             ch_downloader = ChapterDownloader(self.config, manga)
             success, message = ch_downloader.download_chapter(
                 chapter, 
-                on_image_progress=on_image_progress
+                on_image_progress=on_image_progress,
+                lane=lane_key
             )
             
             # Update progress with thread safety
@@ -90,6 +99,7 @@ class DownloadWorker(QThread):
     def run(self):
         try:
             from src.core.models import MangaInfo
+            from src.core.downloader import plan_chapter_lanes
             
             # Convert dict back to MangaInfo
             manga = MangaInfo(
@@ -111,11 +121,12 @@ class DownloadWorker(QThread):
             total = len(self.chapters)
             max_workers = self.config.max_chapter_workers
             
-            # Use ThreadPoolExecutor for concurrent downloads
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # One lane of consecutive chapters per worker, each lane on its own tab
+            lanes = plan_chapter_lanes(self.chapters, max_workers, number=lambda ch: ch["number"])
+            with ThreadPoolExecutor(max_workers=max(1, len(lanes))) as executor:
                 futures = [
-                    executor.submit(self._download_single_chapter, ch, manga, total)
-                    for ch in self.chapters
+                    executor.submit(self._download_lane, (manga.hash_id, i), lane, manga, total)
+                    for i, lane in enumerate(lanes)
                 ]
                 
                 # Wait for all to complete
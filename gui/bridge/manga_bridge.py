@@ -29,8 +29,8 @@ class FetchWorker(QThread):
             # Extract manga code
             manga_code = ComixAPI.extract_manga_code(self.url)
             
-            # Fetch manga info
-            manga = ComixAPI.get_manga_info(manga_code)
+            # Fetch manga info and chapters from one title page load
+            manga, chapters = ComixAPI.fetch_title(manga_code)
             if not manga:
                 self.error.emit("Could not fetch manga information")
                 return
@@ -57,8 +57,6 @@ class FetchWorker(QThread):
             
             self.finished.emit(manga_dict)
             
-            # Fetch chapters
-            chapters = ComixAPI.get_all_chapters(manga_code)
             chapters_list = []
             for ch in chapters:
                 chapters_list.append({
@@ -91,6 +89,10 @@ class MangaBridge(QObject):
         self._manga = None
         self._chapters = []
         self._manga_code = ""
+        
+        # Launch the browser while the user is still entering a URL
+        from src.api.comix import ComixAPI
+        ComixAPI.warm_up()
     
     @pyqtSlot(str)
     def fetchManga(self, url: str):
@@ -0,0 +1,406 @@
+"""
+Shared pool of long-lived nodriver browsers and their tabs.
+
+Launching Chrome costs several seconds and a few hundred MB, so ComixAPI
+borrows tabs (CDP page targets) from this pool instead of starting one
+browser per call. A single browser serves several chapters at once, one
+tab each.
+
+The pool also supervises its browsers: a browser that has served too many
+leases or whose process tree has grown past a memory limit is retired once
+its tabs come back, and work run through BrowserPool.supervise() is watched
+by a heartbeat, so a hung tab is closed and the work re-queued on a new one.
+
+Callers that work through related pages in order (consecutive chapters of
+one series) can pass an affinity key to get the same tab back while it is
+idle, so its loaded reader can be reused.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Hashable, Optional
+from .cookies import get_cookie_store
+from .profile import ProfileSlot, get_profile_store
+from ..utils.logger import get_logger
+from ..utils.nodriver_compat import load_nodriver, load_cdp_module
+from ..utils.process import process_tree_rss
+
+logger = get_logger(__name__)
+
+BROWSER_ARGS = [
+    "--start-maximized",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-ipc-flooding-protection",
+]
+# How long a stopped browser gets to exit before it is killed
+BROWSER_EXIT_TIMEOUT = 5.0
+
+
+class _PooledBrowser:
+    """A running browser together with its reusable tabs."""
+
+    def __init__(self, browser, profile: Optional[ProfileSlot] = None):
+        self.browser = browser
+        # Persistent profile directory, released when the browser is stopped
+        self.profile = profile
+        self.idle_tabs: list = []
+        self.active_tabs = 0
+        # CookieStore.version last injected into this browser
+        self.cookie_version = -1
+        # Tab leases returned so far
+        self.served = 0
+        # Taken out of rotation; stopped once its last tab comes back
+        self.retiring = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return getattr(self.browser, "_process_pid", None)
+
+
+class TabHung(Exception):
+    """A tab missed its heartbeat deadline while running supervised work."""
+
+
+class BrowserPool:
+    """Bounded pool of nodriver browsers, lent out one tab at a time."""
+
+    def __init__(
+        self,
+        size: int = 1,
+        tabs_per_browser: int = 4,
+        headless: bool = True,
+        max_tab_uses: int = 50,
+        health_check_timeout: float = 10.0,
+        max_browser_uses: int = 0,
+        max_browser_rss_mb: int = 0,
+        heartbeat_interval: float = 5.0,
+        heartbeat_timeout: float = 20.0,
+    ):
+        self.size = max(1, int(size))
+        self.tabs_per_browser = max(1, int(tabs_per_browser))
+        self.headless = headless
+        self.max_tab_uses = max_tab_uses
+        self.health_check_timeout = health_check_timeout
+        # 0 disables the limit
+        self.max_browser_uses = max_browser_uses
+        self.max_browser_rss_mb = max_browser_rss_mb
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self._browsers: list[_PooledBrowser] = []
+        # Affinity key -> tab last returned under that key
+        self._affinity: dict[Hashable, Any] = {}
+        self._slots = asyncio.Semaphore(self.size * self.tabs_per_browser)
+        self._lock = asyncio.Lock()
+        self._closed = False
+
+    async def _launch(self) -> _PooledBrowser:
+        """Start a new browser; cookies are injected when its first tab is lent."""
+        uc = load_nodriver()
+        store = get_profile_store()
+        profile = await asyncio.to_thread(store.acquire) if store is not None else None
+        kwargs = {}
+        browser_args = list(BROWSER_ARGS)
+        if profile is not None:
+            # Bundles, fonts and the reader worker then come from the disk cache
+            kwargs["user_data_dir"] = str(profile.path.resolve())
+            browser_args.append(f"--disk-cache-size={store.disk_cache_bytes}")
+        try:
+            browser = await uc.start(headless=self.headless, browser_args=browser_args, **kwargs)
+        except Exception:
+            if profile is not None:
+                profile.release()
+            raise
+        logger.info(f"Launched pooled browser (headless={self.headless})")
+
+        entry = _PooledBrowser(browser, profile)
+        # The start-up tab is the first tab this browser lends out
+        entry.idle_tabs.append(browser.main_tab)
+        return entry
+
+    async def _is_healthy(self, browser) -> bool:
+        """Check that the browser process is alive and answers on CDP."""
+        if browser.stopped:
+            return False
+        try:
+            cdp_browser = load_cdp_module("browser")
+            await asyncio.wait_for(browser.send(cdp_browser.get_version()), self.health_check_timeout)
+            return True
+        except Exception as e:
+            logger.debug(f"Browser health check failed: {e}")
+            return False
+
+    async def _is_tab_healthy(self, tab) -> bool:
+        """Check that a tab still answers on CDP."""
+        try:
+            cdp_runtime = load_cdp_module("runtime")
+            await asyncio.wait_for(tab.send(cdp_runtime.evaluate(expression="1")), self.health_check_timeout)
+            return True
+        except Exception as e:
+            logger.debug(f"Tab health check failed: {e}")
+            return False
+
+    @staticmethod
+    async def _stop(entry: _PooledBrowser) -> None:
+        """Stop a browser and give its profile slot back once the process has exited."""
+        # browser.stop() only sends terminate; keep the process to wait on
+        process = getattr(entry.browser, "_process", None)
+        try:
+            entry.browser.stop()
+        except Exception as e:
+            logger.debug(f"Error stopping browser: {e}")
+        if entry.profile is None:
+            return
+
+        if process is not None:
+            try:
+                await asyncio.wait_for(process.wait(), BROWSER_EXIT_TIMEOUT)
+            except asyncio.TimeoutError:
+                try:
+                    process.kill()
+                    await asyncio.wait_for(process.wait(), BROWSER_EXIT_TIMEOUT)
+                except (asyncio.TimeoutError, ProcessLookupError, OSError) as e:
+                    logger.debug(f"Error killing browser: {e}")
+            except Exception as e:
+                logger.debug(f"Error waiting for browser to exit: {e}")
+            if process.returncode is None:
+                # A new browser on this slot would share the profile with the old one
+                logger.warning(f"Browser did not exit; keeping profile {entry.profile.path} locked")
+                return
+        entry.profile.release()
+
+    async def _close_tab(self, tab) -> None:
+        try:
+            # A hung renderer may never acknowledge the close
+            await asyncio.wait_for(tab.close(), self.health_check_timeout)
+        except Exception as e:
+            logger.debug(f"Error closing tab: {e}")
+
+    async def _retire_reason(self, entry: _PooledBrowser) -> Optional[str]:
+        """Why a browser should be recycled now, if it should."""
+        if self.max_browser_uses and entry.served >= self.max_browser_uses:
+            return f"served {entry.served} tabs"
+        if self.max_browser_rss_mb:
+            rss = await asyncio.to_thread(process_tree_rss, entry.pid)
+            if rss is not None and rss >= self.max_browser_rss_mb * 1024 * 1024:
+                return f"RSS {rss // (1024 * 1024)} MB"
+        return None
+
+    def _retire(self, entry: _PooledBrowser, reason: str) -> None:
+        """Stop lending tabs from a browser; _release stops it once its last tab is back."""
+        if entry.retiring:
+            return
+        entry.retiring = True
+        if entry in self._browsers:
+            self._browsers.remove(entry)
+        logger.info(f"Recycling pooled browser ({reason})")
+
+    async def _checkout_browser(self, preferred_tab=None) -> _PooledBrowser:
+        """Pick a healthy browser with a free tab slot, launching one if needed."""
+        async with self._lock:
+            entries = list(self._browsers)
+            # The browser holding the preferred tab goes first
+            entries.sort(key=lambda entry: preferred_tab is None or preferred_tab not in entry.idle_tabs)
+            for entry in entries:
+                if entry.retiring or entry.active_tabs >= self.tabs_per_browser:
+                    continue
+                if entry.active_tabs == 0 and not await self._is_healthy(entry.browser):
+                    logger.warning("Discarding unhealthy pooled browser")
+                    self._browsers.remove(entry)
+                    await self._stop(entry)
+                    continue
+                entry.active_tabs += 1
+                return entry
+
+            entry = await self._launch()
+            entry.active_tabs += 1
+            self._browsers.append(entry)
+            return entry
+
+    async def _checkout_tab(self, entry: _PooledBrowser, preferred_tab=None):
+        """Reuse an idle tab of the browser or open a new one, with current cookies."""
+        tab = None
+        if preferred_tab is not None and preferred_tab in entry.idle_tabs:
+            entry.idle_tabs.remove(preferred_tab)
+            tab = preferred_tab
+            if not await self._is_tab_healthy(tab):
+                await self._close_tab(tab)
+                tab = None
+        while entry.idle_tabs and tab is None:
+            # Leave tabs kept for an affinity key to their owner when possible
+            kept = {id(t) for t in self._affinity.values()}
+            free = [t for t in entry.idle_tabs if id(t) not in kept]
+            tab = (free or entry.idle_tabs)[-1]
+            entry.idle_tabs.remove(tab)
+            if id(tab) in kept:
+                self._affinity = {key: t for key, t in self._affinity.items() if t is not tab}
+            if not await self._is_tab_healthy(tab):
+                await self._close_tab(tab)
+                tab = None
+
+        if tab is None:
+            tab = await entry.browser.get("about:blank", new_tab=True)
+
+        # Another browser may have picked up newer clearance cookies since
+        store = get_cookie_store()
+        if entry.cookie_version != store.version:
+            entry.cookie_version = store.version
+            await store.inject(tab)
+        return tab
+
+    @asynccontextmanager
+    async def tab(self, affinity: Optional[Hashable] = None):
+        """
+        Borrow a tab; at most size * tabs_per_browser tabs are lent at once.
+
+        With an affinity key, the tab last returned under the same key is lent
+        again if it is still idle.
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        await self._slots.acquire()
+        preferred = self._affinity.pop(affinity, None) if affinity is not None else None
+        entry = None
+        tab = None
+        try:
+            entry = await self._checkout_browser(preferred)
+            tab = await self._checkout_tab(entry, preferred)
+            yield tab
+        finally:
+            if entry is not None:
+                await self._release(entry, tab)
+                if affinity is not None and tab in entry.idle_tabs:
+                    self._affinity[affinity] = tab
+            self._slots.release()
+
+    async def _release(self, entry: _PooledBrowser, tab) -> None:
+        """Return a lent tab and recycle it or its browser if they are worn out or hung."""
+        hung = False
+        if tab is not None:
+            entry.served += 1
+            tab._comix_uses = getattr(tab, "_comix_uses", 0) + 1
+            hung = getattr(tab, "_comix_hung", False)
+            if hung or entry.retiring or self._closed or tab._comix_uses >= self.max_tab_uses:
+                await self._close_tab(tab)
+            else:
+                entry.idle_tabs.append(tab)
+        entry.active_tabs -= 1
+
+        if not entry.retiring and not self._closed:
+            if hung and not await self._is_healthy(entry.browser):
+                reason = "browser stopped responding"
+            else:
+                reason = await self._retire_reason(entry)
+            if reason:
+                self._retire(entry, reason)
+        if (entry.retiring or self._closed) and entry.active_tabs == 0:
+            await self._stop(entry)
+
+    async def _heartbeat(self, tab) -> None:
+        """Return once the tab fails to answer a trivial evaluate within heartbeat_timeout."""
+        cdp_runtime = load_cdp_module("runtime")
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await asyncio.wait_for(tab.send(cdp_runtime.evaluate(expression="1")), self.heartbeat_timeout)
+            except asyncio.TimeoutError:
+                return
+            except Exception as e:
+                # Navigations briefly leave no execution context; only silence counts
+                logger.debug(f"Heartbeat error ignored: {e}")
+
+    async def _run_watched(self, tab, work: Callable[[Any], Awaitable[Any]]) -> Any:
+        """
+        Run work(tab) and abandon it if the tab misses a heartbeat.
+
+        The work never outlives this call: if it is abandoned, or this call is
+        cancelled, the work is cancelled too before the tab goes back to the pool.
+        """
+        work_task = asyncio.ensure_future(work(tab))
+        watch_task = asyncio.ensure_future(self._heartbeat(tab))
+        try:
+            await asyncio.wait({work_task, watch_task}, return_when=asyncio.FIRST_COMPLETED)
+            if work_task.done():
+                return work_task.result()
+            tab._comix_hung = True
+            raise TabHung(f"Tab missed its {self.heartbeat_timeout:.0f}s heartbeat")
+        finally:
+            watch_task.cancel()
+            if not work_task.done():
+                work_task.cancel()
+                # Cleanup in the work may itself wait on a hung tab; don't wait on it for long
+                await asyncio.wait({work_task}, timeout=self.health_check_timeout)
+                if not work_task.done():
+                    # Still busy on the tab, so it must not be lent again
+                    tab._comix_hung = True
+                elif not work_task.cancelled():
+                    work_task.exception()
+
+    async def supervise(
+        self, work: Callable[[Any], Awaitable[Any]], attempts: int = 2, affinity: Optional[Hashable] = None
+    ) -> Any:
+        """
+        Run work(tab) on a borrowed tab under the heartbeat watchdog.
+
+        If the tab hangs, it is closed and the work is re-queued on a fresh
+        tab, up to attempts times in total.
+
+        Args:
+            work: Coroutine function taking the tab
+            attempts: Total runs allowed
+            affinity: Key passed on to tab()
+
+        Returns:
+            Whatever work returns
+        """
+        for attempt in range(1, attempts + 1):
+            try:
+                async with self.tab(affinity) as tab:
+                    return await self._run_watched(tab, work)
+            except TabHung as e:
+                if attempt == attempts:
+                    raise
+                logger.warning(f"{e}; re-queueing on a new tab ({attempt}/{attempts - 1})")
+
+    async def close(self) -> None:
+        """Stop every idle browser; busy ones are stopped when their last tab returns."""
+        self._closed = True
+        self._affinity.clear()
+        async with self._lock:
+            for entry in self._browsers:
+                if entry.active_tabs == 0:
+                    await self._stop(entry)
+            self._browsers.clear()
+        logger.info("Browser pool closed")
+
+
+_pools: dict[bool, BrowserPool] = {}
+
+
+def get_browser_pool(headless: bool) -> BrowserPool:
+    """Get the shared pool for the given headless mode, creating it on first use."""
+    pool = _pools.get(headless)
+    if pool is None:
+        from ..utils.config import ConfigManager
+        config = ConfigManager()
+        pool = BrowserPool(
+            size=config.get("browser_pool_size", 1),
+            tabs_per_browser=config.get("max_tabs_per_browser", 4),
+            headless=headless,
+            max_browser_uses=config.get("browser_max_uses", 200),
+            max_browser_rss_mb=config.get("browser_max_rss_mb", 2048),
+            heartbeat_interval=config.get("tab_heartbeat_interval", 5.0),
+            heartbeat_timeout=config.get("tab_heartbeat_timeout", 20.0),
+        )
+        _pools[headless] = pool
+    return pool
+
+
+async def close_browser_pools() -> None:
+    """Close all shared browser pools."""
+    for pool in list(_pools.values()):
+        await pool.close()
+    _pools.clear()
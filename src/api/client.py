@@ -0,0 +1,164 @@
+"""
+Signed JSON client for the comix.to v2 API.
+
+Runs over the shared requests session, which carries the Cloudflare
+clearance and User-Agent of the last successful browser visit. Callers fall
+back to the browser when a call raises ApiUnavailable. After a Cloudflare
+challenge, calls raise it without a request until the session has a valid
+cf_clearance cookie again.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+import requests
+from ..utils.hash import generate_comix_hash
+from ..utils.logger import get_logger
+from ..utils.session import get_session
+
+logger = get_logger(__name__)
+
+BASE_URL = "https://comix.to/api/v2"
+# Fields of a manga detail that MangaInfo and chapter URLs can't do without
+MANGA_REQUIRED_FIELDS = ("id", "hid", "title", "url")
+
+
+class ApiUnavailable(Exception):
+    """The API could not be reached, answered with a challenge or an error, or returned an unknown payload."""
+
+
+def _is_challenge(response: requests.Response) -> bool:
+    if response.status_code not in (403, 429, 503):
+        return False
+    if response.headers.get("cf-mitigated") == "challenge":
+        return True
+    content_type = response.headers.get("Content-Type", "")
+    return "text/html" in content_type and "cloudflare" in response.text[:5000].lower()
+
+
+def _format_number(value: Any) -> str:
+    """Chapter numbers as they appear in reader URLs (12, 12.5)."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class ComixApiClient:
+    """Calls the v2 endpoints for manga detail, chapter lists and chapter images."""
+
+    CHAPTERS_PER_PAGE = 100
+    # Set once the API answers with a Cloudflare challenge. Until the session
+    # picks up clearance from a browser visit, calls skip straight to the browser.
+    challenged = False
+
+    def __init__(self, base_url: str = BASE_URL, timeout: float = 15.0, max_workers: int = 4):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+    def _get(self, path: str, params: Optional[dict] = None) -> Any:
+        """GET a signed API path and return its result payload."""
+        if ComixApiClient.challenged and not get_session().has_clearance():
+            raise ApiUnavailable(f"No Cloudflare clearance for {path} since the last challenge")
+        signed = {**(params or {}), "_": generate_comix_hash(path)}
+        try:
+            response = get_session().get(f"{self.base_url}{path}", params=signed, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise ApiUnavailable(f"Request to {path} failed: {e}")
+
+        if _is_challenge(response):
+            ComixApiClient.challenged = True
+            raise ApiUnavailable(f"Cloudflare challenge on {path}")
+        # Bad signatures are refused; 404 here means the route itself is unknown
+        if response.status_code in (400, 401, 403, 404):
+            raise ApiUnavailable(f"Request to {path} rejected ({response.status_code})")
+        if response.status_code >= 400:
+            raise ApiUnavailable(f"Request to {path} failed ({response.status_code})")
+
+        try:
+            data = response.json()
+        except ValueError:
+            raise ApiUnavailable(f"Non-JSON response from {path}")
+        if not isinstance(data, dict) or "result" not in data:
+            raise ApiUnavailable(f"Unexpected response shape from {path}")
+        return data["result"]
+
+    def get_manga(self, manga_code: str) -> dict:
+        """Manga detail, in the same shape the title page embeds in #initial-data."""
+        result = self._get(f"/manga/{manga_code}")
+        # Chapter URLs are built from these; a detail without them is not one we know
+        if not isinstance(result, dict) or not all(result.get(key) for key in MANGA_REQUIRED_FIELDS):
+            raise ApiUnavailable(f"Unexpected manga detail for {manga_code}")
+        return result
+
+    def get_chapter_rows(self, manga_code: str) -> list[dict]:
+        """All chapters, newest first, as rows like the DOM scraper produces."""
+        path = f"/manga/{manga_code}/chapters"
+
+        def fetch(page_n: int) -> dict:
+            result = self._get(path, {"limit": self.CHAPTERS_PER_PAGE, "page": page_n, "order[number]": "desc"})
+            if not isinstance(result, dict) or not isinstance(result.get("items"), list):
+                raise ApiUnavailable(f"Unexpected chapter page {page_n} for {manga_code}")
+            return result
+
+        first = fetch(1)
+        # An empty list is more likely a changed endpoint than a title without chapters
+        if not first["items"]:
+            raise ApiUnavailable(f"No chapters listed for {manga_code}")
+        pagination = first.get("pagination") or first.get("meta") or {}
+        try:
+            last_page = int(pagination.get("last_page") or pagination.get("lastPage") or 1)
+        except (AttributeError, TypeError, ValueError):
+            raise ApiUnavailable(f"Unexpected pagination for {manga_code}: {pagination}")
+
+        pages = [first]
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pages.extend(executor.map(fetch, range(2, last_page + 1)))
+
+        rows = []
+        seen_ids = set()
+        for page in pages:
+            for item in page["items"]:
+                row = self._chapter_row(item)
+                if row["chapter_id"] not in seen_ids:
+                    seen_ids.add(row["chapter_id"])
+                    rows.append(row)
+        logger.debug(f"Listed {len(rows)} chapters for {manga_code} in {len(pages)} API requests")
+        return rows
+
+    @staticmethod
+    def _chapter_row(item: dict) -> dict:
+        if not isinstance(item, dict):
+            raise ApiUnavailable(f"Unexpected chapter item: {item}")
+        try:
+            chapter_id = int(item.get("chapter_id") or item["id"])
+            number = _format_number(item["number"])
+        except (KeyError, TypeError, ValueError):
+            raise ApiUnavailable(f"Unexpected chapter item: {item}")
+
+        group = item.get("scanlation_group") or item.get("group") or {}
+        group_name = group.get("name") if isinstance(group, dict) else group
+        if not group_name and item.get("is_official"):
+            group_name = "Official"
+
+        return {
+            "chapter_id": chapter_id,
+            "number": number,
+            "title": item.get("name") or item.get("title") or f"Chapter {number}",
+            "group_name": group_name,
+        }
+
+    def get_chapter_images(self, chapter_id: int) -> list[str]:
+        """Image URLs of a chapter in reading order."""
+        result = self._get(f"/chapters/{chapter_id}")
+        images = result.get("images") if isinstance(result, dict) else None
+        if not isinstance(images, list):
+            raise ApiUnavailable(f"No image list for chapter {chapter_id}")
+
+        urls = []
+        for image in images:
+            url = image.get("url") if isinstance(image, dict) else image
+            if not isinstance(url, str):
+                raise ApiUnavailable(f"Unexpected image entry for chapter {chapter_id}: {image}")
+            urls.append(url)
+        return urls
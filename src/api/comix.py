@@ -2,26 +2,591 @@
 Comix.to API wrapper for manga information and chapter data.
 """
 
+import base64
 import json
 import re
 import asyncio
-import threading
-from typing import Optional
+import atexit
+import time
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Callable, Hashable, Iterator, Optional
+from urllib.parse import urlparse
+from .browser import get_browser_pool, close_browser_pools
+from .client import ApiUnavailable, ComixApiClient
+from .cookies import get_cookie_store
+from .network import NetworkCapture, ResourceBlocker
+from ..utils.async_loop import get_event_loop_thread, run_async
+from ..utils.latency import get_latency_tracker
 from ..utils.retry import retry_with_backoff
 from ..utils.logger import get_logger
 from ..utils.session import get_session
-from ..utils.hash import generate_comix_hash
-from ..utils.nodriver_compat import load_cdp_page, load_nodriver
+from ..utils.nodriver_compat import load_cdp_page, load_cdp_module
 
 logger = get_logger(__name__)
 
-# Global lock to synchronize browser creation and cookie loading/saving across threads
-_browser_lock = threading.Lock()
 
+@atexit.register
+def _shutdown_browsers() -> None:
+    """Stop pooled browsers when the interpreter exits."""
+    loop_thread = get_event_loop_thread()
+    if not loop_thread.is_running:
+        return
+    try:
+        loop_thread.submit(close_browser_pools()).result(timeout=10)
+    except Exception as e:
+        logger.debug(f"Error closing browser pools: {e}")
 
-def run_async(coro):
-    """Run an async coroutine synchronously."""
-    return asyncio.run(coro)
+
+# Scrapes the rows of a chapter list from a document
+_READ_CHAPTER_ROWS_JS = """(root) => Array.from(root.querySelectorAll('.mchap-item')).map(li => {
+        const a = li.querySelector('.mchap-row__primary');
+        const ch = li.querySelector('.mchap-row__ch');
+        const ti = li.querySelector('.mchap-row__title');
+        const gp = li.querySelector('.mchap-row__group');
+        return {
+            href: a ? a.getAttribute('href') : null,
+            chap_label: ch ? ch.textContent.trim() : null,
+            title: ti ? ti.textContent.trim() : null,
+            group: gp ? (gp.querySelector('span') ? gp.querySelector('span').textContent.trim() : gp.textContent.trim()) : null,
+            group_official: gp ? gp.classList.contains('is-official') : false,
+        };
+    })"""
+
+# Scrapes the visible rows of a title page's chapter list
+_CHAPTER_ROWS_JS = "JSON.stringify((" + _READ_CHAPTER_ROWS_JS + ")(document))"
+
+# Highest ?page=N linked from the chapter list's pagination controls, or null
+_LAST_LIST_PAGE_JS = """(() => {
+    let last = 0;
+    for (const a of document.querySelectorAll('a[href*="page="]')) {
+        const link = new URL(a.href, location.href);
+        if (link.pathname !== location.pathname) continue;
+        const n = parseInt(link.searchParams.get('page'), 10);
+        if (n > last) last = n;
+    }
+    return last || null;
+})()"""
+
+# Fetches chapter list pages with the tab's cookies and parses their rows with
+# DOMParser, a few requests at a time. Pages that fail or render no rows
+# server-side come back as null.
+_FETCH_LIST_PAGES_JS = """async (urls, concurrency) => {
+    const readRows = """ + _READ_CHAPTER_ROWS_JS + """;
+    const results = urls.map(() => null);
+    let next = 0;
+    const worker = async () => {
+        while (next < urls.length) {
+            const i = next++;
+            try {
+                const resp = await fetch(urls[i], {credentials: 'include'});
+                if (!resp.ok) continue;
+                const doc = new DOMParser().parseFromString(await resp.text(), 'text/html');
+                const rows = readRows(doc);
+                if (rows.length) results[i] = rows;
+            } catch (e) {}
+        }
+    };
+    await Promise.all(Array.from({length: Math.min(concurrency, urls.length)}, worker));
+    return JSON.stringify(results);
+}"""
+
+_MAX_LIST_PAGES = 200
+_LIST_FETCH_CONCURRENCY = 6
+
+# Wait budgets. Per-page render matches the old 150 x 0.2 s polling loop.
+_PAGE_READY_TIMEOUT_MS = 30000
+
+# Per wait type: (default budget, floor) in seconds. Deadlines are learned from
+# earlier waits of the same type and stay between the two.
+_WAIT_BUDGETS = {
+    "title_page": (15.0, 5.0),
+    "initial_data": (10.0, 3.0),
+    "chapter_rows": (4.0, 1.5),
+    "reader_ready": (_PAGE_READY_TIMEOUT_MS / 1000, 8.0),
+    "first_page": (_PAGE_READY_TIMEOUT_MS / 1000, 8.0),
+    "page_render": (_PAGE_READY_TIMEOUT_MS / 1000, 5.0),
+    # Whole window of pages rendering in parallel under a tall viewport
+    "viewport_window": (45.0, 8.0),
+}
+
+# Budget for an in-reader move to the next chapter before falling back to a
+# full page load
+_READER_NAVIGATION_TIMEOUT = 8.0
+
+# Viewport used by the "viewport" extraction mode; tall enough that the reader
+# lazily renders and decrypts a run of pages at once instead of one per scroll
+_TALL_VIEWPORT_WIDTH = 1280
+_TALL_VIEWPORT_HEIGHT = 12000
+
+# In-page wait primitive: resolves with check()'s value as soon as it is truthy,
+# or null after timeoutMs. Re-checks on DOM mutations and resource load events,
+# plus a fallback tick (tickMs) because canvas paints do not mutate the DOM.
+_WAIT_FOR_JS = """(check, timeoutMs, tickMs) => new Promise((resolve) => {
+    let done = false;
+    let scheduled = false;
+    let observer = null;
+    let tick = null;
+    let timer = null;
+    const finish = (value) => {
+        if (done) return;
+        done = true;
+        if (observer) observer.disconnect();
+        clearInterval(tick);
+        clearTimeout(timer);
+        window.removeEventListener('load', schedule, true);
+        resolve(value);
+    };
+    const test = () => {
+        scheduled = false;
+        if (done) return;
+        let value = null;
+        try {
+            value = check();
+        } catch (e) {}
+        if (value) finish(value);
+    };
+    const schedule = () => {
+        if (!scheduled) {
+            scheduled = true;
+            queueMicrotask(test);
+        }
+    };
+    test();
+    if (done) return;
+    observer = new MutationObserver(schedule);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    window.addEventListener('load', schedule, true);
+    tick = setInterval(schedule, tickMs || 250);
+    timer = setTimeout(() => finish(null), timeoutMs);
+})"""
+
+# Reader-side extraction runtime, installed once per tab as window.__comix by
+# an init script (and on demand if a document came up without it). Python
+# calls its functions with short expressions and takes the results by value.
+# Canvas pages are encoded with toBlob and kept in a blob table for
+# _take_blob(); only small per-page metadata comes back.
+#   ready(n)              readiness of page n as its type string ('canvas',
+#                         'img', 'skip', 'missing'), or null while rendering
+#   extract(n, ...)       encode/resolve page n once ready
+#   extractBatch(...)     scroll pages [first, last] into view one at a time and
+#                         extract each, with the render wait in ms
+#   extractAll(...)       extractBatch over every page of the reader
+#   harvest(pending, ...) wait until any pending page is ready, then extract
+#                         all ready ones concurrently without scrolling
+#   visible(pages)        pages of the list intersecting the viewport
+#   navigate(path)        client-side move to another chapter of the reader
+#   landed(path)          whether that move has replaced the pages' content
+_READER_RUNTIME_JS = """(() => {
+    if (window.__comix) return;
+    // Canvas readback as it was before the site's scripts ran; they tamper with it
+    const origToBlob = window.__origToBlob || HTMLCanvasElement.prototype.toBlob;
+    const origCreateImageBitmap = window.__origCreateImageBitmap || window.createImageBitmap;
+    const origGetImageData = window.__origGetImageData || CanvasRenderingContext2D.prototype.getImageData;
+    const blobs = {};
+    const waitFor = """ + _WAIT_FOR_JS + """;
+    const pageEl = (n) => document.querySelector(`.rpage-page[data-page="${n}"]`);
+    // A painted canvas, a loaded image (blob: images are copied to a canvas),
+    // a 1x1 placeholder to skip, or null
+    const probe = (el) => {
+        const c = el.querySelector('canvas');
+        if (c && c.width > 10 && c.height > 10) {
+            return el.classList.contains('is-loading') ? null : {type: 'canvas', canvas: c};
+        }
+        const i = el.querySelector('img');
+        if (i && i.src && i.complete) {
+            if (i.naturalWidth > 10 && i.naturalHeight > 10) {
+                if (!i.src.startsWith('blob:')) return {type: 'img', src: i.src};
+                const canvas = document.createElement('canvas');
+                canvas.width = i.naturalWidth;
+                canvas.height = i.naturalHeight;
+                canvas.getContext('2d').drawImage(i, 0, 0);
+                return {type: 'canvas', canvas: canvas};
+            }
+            if (i.naturalWidth > 0 && i.naturalWidth <= 10) return {type: 'skip'};
+        }
+        return null;
+    };
+    // Clearly uniform canvases are recognised from a downscaled sample before
+    // any encoding: one colour must cover nearly every sample AND the luma
+    // variance must be near zero. Sparse line art or a few lines of text fail
+    // one of the two and go on to the encoded-size check like any other page.
+    // null when the pixels can't be read (no 2d context, tainted canvas).
+    const SAMPLE_SIZE = 32;
+    const BLANK_MAX_VARIANCE = 4;
+    const BLANK_MIN_DOMINANT = 0.985;
+    let sampler = null;
+    const isBlank = (c) => {
+        try {
+            sampler = sampler || document.createElement('canvas');
+            sampler.width = SAMPLE_SIZE;
+            sampler.height = SAMPLE_SIZE;
+            const ctx = sampler.getContext('2d', {willReadFrequently: true});
+            ctx.clearRect(0, 0, SAMPLE_SIZE, SAMPLE_SIZE);
+            ctx.drawImage(c, 0, 0, SAMPLE_SIZE, SAMPLE_SIZE);
+            const px = origGetImageData.call(ctx, 0, 0, SAMPLE_SIZE, SAMPLE_SIZE).data;
+            const total = SAMPLE_SIZE * SAMPLE_SIZE;
+            const colors = new Map();
+            let sum = 0;
+            let sumSq = 0;
+            for (let i = 0; i < px.length; i += 4) {
+                const y = 0.299 * px[i] + 0.587 * px[i + 1] + 0.114 * px[i + 2];
+                sum += y;
+                sumSq += y * y;
+                // 4 bits per channel plus opacity, so JPEG-ish noise doesn't count as detail
+                const key = ((px[i] >> 4) << 12) | ((px[i + 1] >> 4) << 8) | ((px[i + 2] >> 4) << 4) | (px[i + 3] >> 4);
+                colors.set(key, (colors.get(key) || 0) + 1);
+            }
+            const mean = sum / total;
+            const variance = sumSq / total - mean * mean;
+            const dominant = Math.max(...colors.values()) / total;
+            return variance < BLANK_MAX_VARIANCE && dominant >= BLANK_MIN_DOMINANT;
+        } catch (e) {
+            return null;
+        }
+    };
+    const probePage = (n) => {
+        const el = pageEl(n);
+        return el ? probe(el) : {type: 'missing'};
+    };
+    // Encoding runs on a pool of workers: the canvas is snapshotted into an
+    // ImageBitmap on the main thread, transferred, drawn on an OffscreenCanvas
+    // and encoded there with convertToBlob, so pages encode on several cores.
+    // Without Worker/OffscreenCanvas support (or when CSP refuses blob:
+    // workers) encoding falls back to the canvas' own toBlob. A worker that
+    // fails as a whole (CSP error event, crash, out of memory) shuts the pool
+    // down, and a job that gets no answer in time is encoded on the page, so
+    // an encode always settles.
+    const ENCODER_SRC = `self.onmessage = async (e) => {
+        const {id, bitmap, mime, quality} = e.data;
+        try {
+            const canvas = new OffscreenCanvas(bitmap.width, bitmap.height);
+            canvas.getContext('2d').drawImage(bitmap, 0, 0);
+            bitmap.close();
+            self.postMessage({id, blob: await canvas.convertToBlob({type: mime, quality})});
+        } catch (err) {
+            self.postMessage({id, error: String(err)});
+        }
+    };`;
+    const ENCODE_TIMEOUT_MS = 20000;
+    let encoders = null;
+    let encodeSeq = 0;
+    // id -> callback taking the worker's reply ({blob} or {error})
+    const encodeJobs = new Map();
+    const settleJob = (id, msg) => {
+        const job = encodeJobs.get(id);
+        encodeJobs.delete(id);
+        if (job) job(msg);
+    };
+    const stopEncoders = () => {
+        encoders.forEach((worker) => worker.terminate());
+        encoders = [];
+        [...encodeJobs.keys()].forEach((id) => settleJob(id, {error: 'encoder pool stopped'}));
+    };
+    const startEncoders = () => {
+        if (encoders !== null) return encoders;
+        encoders = [];
+        try {
+            if (typeof OffscreenCanvas === 'undefined' || typeof origCreateImageBitmap !== 'function') return encoders;
+            const url = URL.createObjectURL(new Blob([ENCODER_SRC], {type: 'text/javascript'}));
+            const size = Math.max(1, Math.min(4, (navigator.hardwareConcurrency || 2) - 1));
+            for (let i = 0; i < size; i++) {
+                const worker = new Worker(url);
+                worker.busy = 0;
+                worker.onmessage = (e) => {
+                    worker.busy--;
+                    settleJob(e.data.id, e.data);
+                };
+                worker.onerror = (e) => {
+                    e.preventDefault();
+                    stopEncoders();
+                };
+                encoders.push(worker);
+            }
+        } catch (e) {
+            encoders = [];
+        }
+        return encoders;
+    };
+    const toBlobOnPage = (c, mime, quality) => new Promise((resolve) => origToBlob.call(c, resolve, mime, quality));
+    const encode = (c, mime, quality) => {
+        const pool = startEncoders();
+        if (!pool.length) return toBlobOnPage(c, mime, quality);
+        // The bitmap snapshots the canvas now, before the reader can repaint it
+        const snapshot = origCreateImageBitmap.call(window, c);
+        return snapshot.then((bitmap) => new Promise((resolve) => {
+            // The pool may have been stopped while the snapshot was taken
+            if (!encoders.length) {
+                bitmap.close();
+                resolve(toBlobOnPage(c, mime, quality));
+                return;
+            }
+            const worker = encoders.reduce((a, b) => (b.busy < a.busy ? b : a));
+            const id = ++encodeSeq;
+            const timer = setTimeout(() => settleJob(id, {error: 'encode timed out'}), ENCODE_TIMEOUT_MS);
+            worker.busy++;
+            encodeJobs.set(id, (msg) => {
+                clearTimeout(timer);
+                resolve(msg.error ? toBlobOnPage(c, mime, quality) : msg.blob);
+            });
+            worker.postMessage({id, bitmap, mime, quality}, [bitmap]);
+        })).catch(() => toBlobOnPage(c, mime, quality));
+    };
+    const encodePage = async (n, res, mime, quality) => {
+        if (!res) return {type: 'timeout'};
+        if (res.type !== 'canvas') return res;
+        if (isBlank(res.canvas)) return {type: 'skip', sampled: true};
+        const blob = await encode(res.canvas, mime, quality);
+        // Blank/ad canvases the sample could not judge encode to tiny files
+        if (!blob || blob.size < 15000) return {type: 'skip'};
+        blobs[n] = blob;
+        return {type: 'blob', size: blob.size};
+    };
+    // One page failing to encode must not reject the Promise.all of its batch
+    const finish = (n, res, mime, quality) =>
+        encodePage(n, res, mime, quality).catch((e) => ({type: 'error', error: String(e)}));
+    // What the reader currently shows: page count, the first page's media
+    // element, its image source and a tiny pixel fingerprint of its canvas.
+    // The router may reuse page nodes (and even canvases) across chapters, so
+    // a move has landed once any of these differ from before it.
+    let printer = null;
+    const fingerprint = (c) => {
+        try {
+            printer = printer || document.createElement('canvas');
+            printer.width = 8;
+            printer.height = 8;
+            const ctx = printer.getContext('2d', {willReadFrequently: true});
+            ctx.clearRect(0, 0, 8, 8);
+            ctx.drawImage(c, 0, 0, 8, 8);
+            return origGetImageData.call(ctx, 0, 0, 8, 8).data.join(',');
+        } catch (e) {
+            return null;
+        }
+    };
+    const contentState = () => {
+        const first = document.querySelector('.rpage-page');
+        const media = first ? first.querySelector('canvas, img') : null;
+        const canvas = media && media.tagName === 'CANVAS' && media.width > 10 ? media : null;
+        return {
+            count: api.pageCount(),
+            media,
+            src: media && media.tagName === 'IMG' ? media.src : null,
+            pixels: canvas ? fingerprint(canvas) : null,
+        };
+    };
+    let leaving = null;
+    const api = {
+        pageCount: () => document.querySelectorAll('.rpage-page').length,
+        scrollTo: (n, block) => {
+            const el = pageEl(n);
+            if (el) el.scrollIntoView({behavior: 'instant', block: block || 'center'});
+            return !!el;
+        },
+        ready: (n) => {
+            const res = probePage(n);
+            return res ? res.type : null;
+        },
+        extract: (n, mime, quality) => finish(n, probePage(n), mime, quality),
+        extractBatch: async (first, last, timeoutMs, mime, quality, tickMs) => {
+            // Encodes run in the background while later pages render; results stay in page order
+            const results = [];
+            for (let n = first; n <= last; n++) {
+                const el = pageEl(n);
+                if (!el) {
+                    results.push({type: 'missing'});
+                    continue;
+                }
+                el.scrollIntoView({behavior: 'instant', block: 'center'});
+                const t0 = performance.now();
+                const res = await waitFor(() => probe(el), timeoutMs, tickMs);
+                const ms = Math.round(performance.now() - t0);
+                results.push(finish(n, res, mime, quality).then((out) => (res ? {...out, ms} : out)));
+            }
+            return Promise.all(results);
+        },
+        extractAll: (timeoutMs, mime, quality, tickMs) =>
+            api.extractBatch(1, api.pageCount(), timeoutMs, mime, quality, tickMs),
+        harvest: async (pending, timeoutMs, mime, quality, tickMs) => {
+            const ready = await waitFor(() => {
+                const found = pending.map((n) => [n, probePage(n)]).filter(([, res]) => res);
+                return found.length ? found : null;
+            }, timeoutMs, tickMs);
+            if (!ready) return [];
+            return Promise.all(ready.map(async ([n, res]) => ({...await finish(n, res, mime, quality), page: n})));
+        },
+        visible: (pages) => pages.filter((n) => {
+            const el = pageEl(n);
+            if (!el) return false;
+            const r = el.getBoundingClientRect();
+            return r.bottom > 0 && r.top < window.innerHeight;
+        }),
+        // In-app move to another chapter: follow the reader's own link to it
+        // (its next/previous chapter control) so the router swaps the pages
+        // without reloading the document. What is shown now is remembered.
+        navigate: (path) => {
+            const link = [...document.querySelectorAll('a[href]')].find((a) => {
+                try {
+                    return new URL(a.href, location.href).pathname === path;
+                } catch (e) {
+                    return false;
+                }
+            });
+            if (!link) return false;
+            leaving = contentState();
+            link.click();
+            return true;
+        },
+        landed: (path) => {
+            if (location.pathname !== path) return false;
+            const now = contentState();
+            if (!now.count) return false;
+            return !leaving || now.count !== leaving.count || now.media !== leaving.media
+                || now.src !== leaving.src || now.pixels !== leaving.pixels;
+        },
+        takeBlob: (n) => {
+            const blob = blobs[n];
+            delete blobs[n];
+            return blob;
+        },
+    };
+    window.__comix = api;
+})();"""
+
+# IO.read chunk size for blob transfers
+_BLOB_CHUNK_SIZE = 1 << 20
+
+
+async def _wait_for(page, condition_js: str, timeout: float, tick_ms: int = 250) -> Any:
+    """
+    Await an in-page condition with a single evaluate.
+    
+    Returns the condition's truthy value, or None on timeout. If a navigation
+    destroys the page context while waiting, the wait restarts on the new
+    document with the remaining time.
+    
+    The evaluate is sent as a raw Runtime.evaluate: page.evaluate asks for
+    deep serialization, which overrides returnByValue, so object results
+    would come back as RemoteObjects without a value.
+    """
+    cdp_runtime = load_cdp_module("runtime")
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        expression = f"({_WAIT_FOR_JS})(() => ({condition_js}), {int(remaining * 1000)}, {tick_ms})"
+        try:
+            remote, errors = await page.send(cdp_runtime.evaluate(
+                expression=expression, await_promise=True, return_by_value=True
+            ))
+        except Exception as e:
+            logger.debug(f"Wait interrupted, retrying: {e}")
+            await asyncio.sleep(0.2)
+            continue
+        if errors:
+            # JS exception (e.g. context destroyed by navigation)
+            logger.debug(f"Wait raised in page, retrying: {errors.text}")
+            await asyncio.sleep(0.2)
+            continue
+        return remote.value or None
+
+
+async def _adaptive_wait(page, kind: str, condition_js: str, retry: bool = False) -> Any:
+    """
+    _wait_for with a deadline learned from earlier waits of the same kind.
+    
+    The outcome is recorded for later deadlines. With retry, a wait that
+    times out on a learned deadline keeps going up to the full default budget.
+    """
+    tracker = get_latency_tracker()
+    default, floor = _WAIT_BUDGETS[kind]
+    timeout = tracker.deadline(kind, default, floor)
+    tick_ms = tracker.poll_interval_ms(kind)
+    
+    start = time.monotonic()
+    result = await _wait_for(page, condition_js, timeout, tick_ms)
+    if result is None:
+        tracker.record_timeout(kind)
+        logger.debug(f"Wait '{kind}' gave up after {timeout:.1f}s")
+        if retry and timeout < default:
+            result = await _wait_for(page, condition_js, default - timeout, tick_ms)
+            if result is not None:
+                tracker.record(kind, time.monotonic() - start)
+    else:
+        tracker.record(kind, time.monotonic() - start)
+    return result
+
+
+async def _take_blob(page, page_num: int) -> bytes:
+    """
+    Read a page Blob stashed by the reader runtime as raw bytes.
+    
+    The Blob is resolved to a CDP stream and read with IO.read, so it never
+    becomes a data URL or passes through JSON.stringify.
+    """
+    cdp_runtime = load_cdp_module("runtime")
+    cdp_io = load_cdp_module("io")
+    remote, errors = await page.send(cdp_runtime.evaluate(expression=f"window.__comix.takeBlob({page_num})"))
+    if errors or not remote.object_id:
+        raise RuntimeError(f"No blob stored for page {page_num}")
+        
+    handle = None
+    try:
+        uuid = await page.send(cdp_io.resolve_blob(object_id=remote.object_id))
+        handle = cdp_io.StreamHandle(f"blob:{uuid}")
+        data = bytearray()
+        while True:
+            base64_encoded, chunk, eof = await page.send(cdp_io.read(handle=handle, size=_BLOB_CHUNK_SIZE))
+            data.extend(base64.b64decode(chunk) if base64_encoded else chunk.encode("utf-8"))
+            if eof:
+                break
+        return bytes(data)
+    finally:
+        try:
+            if handle is not None:
+                await page.send(cdp_io.close(handle=handle))
+            await page.send(cdp_runtime.release_object(object_id=remote.object_id))
+        except Exception as e:
+            logger.debug(f"Failed to release blob for page {page_num}: {e}")
+
+
+async def _ensure_runtime(page) -> None:
+    """Install window.__comix if the init script did not run for this document."""
+    if await _runtime_call(page, "typeof window.__comix === 'object'", await_promise=False):
+        return
+    logger.debug("Reader runtime missing, installing it in the page")
+    await _runtime_call(page, _READER_RUNTIME_JS, await_promise=False)
+
+
+async def _runtime_call(page, expression: str, await_promise: bool = True) -> Any:
+    """
+    Evaluate a short expression (usually a window.__comix call) and return its value.
+    
+    Unlike page.evaluate, falsy values such as [] or null come back as
+    themselves, and an exception in the page raises RuntimeError.
+    """
+    cdp_runtime = load_cdp_module("runtime")
+    remote, errors = await page.send(cdp_runtime.evaluate(
+        expression=expression, await_promise=await_promise, return_by_value=True
+    ))
+    if errors:
+        detail = errors.exception.description if errors.exception is not None else errors.text
+        raise RuntimeError(f"{expression[:60]}: {detail}")
+    return remote.value
+
+
+async def _sync_browser_state(tab) -> None:
+    """
+    Keep what a successful visit left behind: cookies for new browsers, and
+    cookies plus the real User-Agent for the HTTP session.
+    """
+    store = get_cookie_store()
+    await store.update_from(tab)
+    try:
+        user_agent = await tab.evaluate("navigator.userAgent")
+    except Exception as e:
+        logger.debug(f"Could not read browser User-Agent: {e}")
+        user_agent = None
+    get_session().apply_browser_state(store.cookies, user_agent if isinstance(user_agent, str) else None)
 
 
 class ComixAPI:
@@ -41,89 +606,164 @@ class ComixAPI:
         logger.debug(f"Extracted manga code: {code} from URL: {url}")
         return code
     
+    @staticmethod
+    async def _pass_cloudflare(page, headless: bool) -> str:
+        """Detect the Cloudflare interstitial and let the user solve it. Returns the document title."""
+        title = await page.evaluate("document.title")
+        if "moment" in title.lower():
+            logger.warning("Cloudflare challenge detected.")
+            if headless:
+                logger.error("Cannot solve Cloudflare challenge in headless mode. Run with headless=False first.")
+            else:
+                print("\n[!] Still on the Cloudflare challenge page.")
+                print("[!] Solve the checkbox manually in the browser window now.")
+                await asyncio.get_running_loop().run_in_executor(
+                    None, input, "    Press ENTER *after* the page has fully loaded (title changes)...\n"
+                )
+                await page
+                title = await page.evaluate("document.title")
+        return title
+
+    @staticmethod
+    async def _read_initial_data(page) -> Optional[str]:
+        """Read the #initial-data JSON embedded in a title page."""
+        return await _adaptive_wait(
+            page,
+            "initial_data",
+            "document.getElementById('initial-data') ? document.getElementById('initial-data').innerHTML : null",
+            retry=True,
+        )
+
     @classmethod
-    async def _get_manga_info_async(cls, manga_code: str, headless: bool) -> Optional[str]:
-        uc = load_nodriver()
-        from pathlib import Path
-        
+    async def _fetch_title_async(
+        cls, manga_code: str, headless: bool, with_info: bool = True, with_chapters: bool = True
+    ) -> tuple[Optional[str], list[dict]]:
+        """Load a title page once and read its initial-data and/or chapter rows from it."""
         url = f"https://comix.to/title/{manga_code}"
-        cookie_file = Path("cf_cookies.dat")
-        
-        _browser_lock.acquire()
-        try:
-            browser = await uc.start(
-                headless=headless,
-                browser_args=[
-                    "--start-maximized",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--disable-ipc-flooding-protection",
-                ]
-            )
-            
-            if cookie_file.exists():
-                try:
-                    await browser.cookies.load(str(cookie_file))
-                    logger.info(f"Loaded cookies from {cookie_file}")
-                except Exception as e:
-                    logger.warning(f"Failed loading cookies: {e}")
-        finally:
-            _browser_lock.release()
+        script_content = None
+        rows = []
         
-        try:
-            page = await browser.get(url)
-            await page.sleep(5)
-            
-            title = await page.evaluate("document.title")
-            if "moment" in title.lower():
-                logger.warning("Cloudflare challenge detected.")
-                if headless:
-                    logger.error("Cannot solve Cloudflare challenge in headless mode. Run with headless=False first.")
-                else:
-                    print("\n[!] Still on the Cloudflare challenge page.")
-                    print("[!] Solve the checkbox manually in the browser window now.")
-                    input("    Press ENTER *after* the page has fully loaded (title changes)...\n")
-                    await page
-                    title = await page.evaluate("document.title")
-            
-            script_content = None
-            for _ in range(20):
-                script_content = await page.evaluate(
-                    "document.getElementById('initial-data') ? document.getElementById('initial-data').innerHTML : null"
+        async with get_browser_pool(headless).tab() as tab:
+            # The title scrapers only read the DOM, so images can be dropped too
+            blocker = ResourceBlocker.from_config(tab, extra_types=("Image",))
+            if blocker is not None:
+                await blocker.start()
+            try:
+                page = await tab.get(url)
+                # Continue as soon as the title page content or a Cloudflare challenge is there
+                await _adaptive_wait(
+                    page,
+                    "title_page",
+                    "document.title.toLowerCase().includes('moment') || "
+                    "!!(document.getElementById('initial-data') || document.querySelector('.mchap-item'))",
                 )
-                if script_content:
-                    break
-                await page.sleep(0.5)
+                title = await cls._pass_cloudflare(page, headless)
                 
-            if "moment" not in title.lower():
-                _browser_lock.acquire()
-                try:
-                    await browser.cookies.save(str(cookie_file), pattern=".*")
-                    logger.info(f"Saved cookies to {cookie_file}")
-                except Exception as e:
-                    logger.warning(f"Failed saving cookies: {e}")
-                finally:
-                    _browser_lock.release()
+                if with_info:
+                    script_content = await cls._read_initial_data(page)
+                if with_chapters:
+                    rows = await cls._scrape_chapter_rows(page, url)
+                    
+                if "moment" not in title.lower():
+                    await _sync_browser_state(tab)
+            finally:
+                if blocker is not None:
+                    await blocker.stop()
                 
-            return script_content
-            
-        finally:
-            browser.stop()
-            
+        return script_content, rows
+
     @classmethod
-    def get_manga_info(cls, manga_code: str, headless: Optional[bool] = None) -> Optional[any]:
-        """Fetch manga information from DOM using nodriver."""
-        from ..core.models import MangaInfo
+    async def _get_manga_info_async(cls, manga_code: str, headless: bool) -> Optional[str]:
+        script_content, _ = await cls._fetch_title_async(manga_code, headless, with_chapters=False)
+        return script_content
+            
+    @staticmethod
+    def _resolve_headless(headless: Optional[bool], config: Any = None) -> bool:
         if headless is None:
+            if config is None:
+                from ..utils.config import ConfigManager
+                config = ConfigManager()
+            headless = config.get("headless", True)
+        return headless
+
+    @classmethod
+    async def _warm_up_async(cls, headless: bool) -> None:
+        """Launch a pooled browser and load the site origin so TLS and clearance are ready."""
+        try:
+            async with get_browser_pool(headless).tab() as tab:
+                blocker = ResourceBlocker.from_config(tab, extra_types=("Image",))
+                if blocker is not None:
+                    await blocker.start()
+                try:
+                    page = await tab.get("https://comix.to/")
+                    title = await _wait_for(
+                        page,
+                        "document.readyState !== 'loading' && document.title ? document.title : null",
+                        _WAIT_BUDGETS["title_page"][0],
+                    ) or ""
+                    if "moment" in title.lower():
+                        logger.info("Cloudflare challenge during warm-up; it will be handled on the first fetch")
+                    elif title:
+                        await _sync_browser_state(tab)
+                        logger.info("Browser warmed up")
+                finally:
+                    if blocker is not None:
+                        await blocker.stop()
+        except Exception as e:
+            logger.warning(f"Browser warm-up failed: {e}")
+
+    @classmethod
+    def warm_up(cls, headless: Optional[bool] = None) -> Optional[Future]:
+        """
+        Start a browser and open the comix.to origin on the background event loop.
+        Returns immediately; the first fetch then reuses the running browser.
+        
+        Returns:
+            Future of the warm-up, or None when warm_up_browser is disabled
+        """
+        from ..utils.config import ConfigManager
+        if not ConfigManager().get("warm_up_browser", True):
+            return None
+        headless = cls._resolve_headless(headless)
+        return get_event_loop_thread().submit(cls._warm_up_async(headless))
+
+    @classmethod
+    def _api_client(cls, config: Any = None) -> Optional[ComixApiClient]:
+        """JSON API client, or None when the API tier is disabled."""
+        if config is None:
             from ..utils.config import ConfigManager
-            headless = ConfigManager().get("headless", True)
-            
+            config = ConfigManager()
+        if not config.get("use_api", True):
+            return None
+        return ComixApiClient(cls.BASE_URL)
+
+    @staticmethod
+    async def _call_api(what: str, func, *args) -> Any:
+        """Run a blocking API call in a worker thread; None means use the browser instead."""
+        try:
+            return await asyncio.to_thread(func, *args)
+        except ApiUnavailable as e:
+            logger.info(f"API unavailable for {what}, falling back to browser: {e}")
+        except Exception as e:
+            logger.warning(f"API failed for {what}, falling back to browser: {e}")
+        return None
+
+    @classmethod
+    async def get_manga_info_async(cls, manga_code: str, headless: Optional[bool] = None) -> Optional[any]:
+        """Fetch manga information from the API, or from DOM using nodriver. Can be awaited from any event loop."""
+        client = cls._api_client()
+        if client is not None:
+            manga_detail = await cls._call_api(f"manga {manga_code}", client.get_manga, manga_code)
+            if manga_detail is not None:
+                return cls._manga_detail_to_info(manga_detail)
+                
+        headless = cls._resolve_headless(headless)
         logger.info(f"Fetching manga info using nodriver (headless={headless}) for {manga_code}...")
         
         try:
-            initial_data_str = run_async(cls._get_manga_info_async(manga_code, headless))
+            initial_data_str = await get_event_loop_thread().run_coroutine(
+                cls._get_manga_info_async(manga_code, headless)
+            )
             if not initial_data_str:
                 return None
             json_data = json.loads(initial_data_str)
@@ -131,6 +771,16 @@ class ComixAPI:
             logger.error(f"nodriver failed to fetch manga info for {manga_code}: {e}")
             return None
 
+        return cls._parse_manga_info(json_data, manga_code)
+
+    @classmethod
+    def get_manga_info(cls, manga_code: str, headless: Optional[bool] = None) -> Optional[any]:
+        """Fetch manga information from the API, or from DOM using nodriver."""
+        return run_async(cls.get_manga_info_async(manga_code, headless))
+
+    @staticmethod
+    def _parse_manga_info(json_data: dict, manga_code: str) -> Optional[any]:
+        """Build MangaInfo from the page's #initial-data JSON."""
         # Find the manga detail query in the json_data
         manga_detail = None
         queries = json_data.get("queries", {})
@@ -143,6 +793,13 @@ class ComixAPI:
             logger.error(f"Could not find manga detail in initial-data for {manga_code}. Keys: {list(queries.keys())}")
             return None
             
+        return ComixAPI._manga_detail_to_info(manga_detail)
+    
+    @staticmethod
+    def _manga_detail_to_info(manga_detail: dict) -> Optional[any]:
+        """Build MangaInfo from a manga detail object (API result or initial-data query)."""
+        from ..core.models import MangaInfo
+        
         # Get alt titles safely
         alt_titles = manga_detail.get("altTitles", [])
         if not isinstance(alt_titles, list):
@@ -186,418 +843,692 @@ class ComixAPI:
         )
     
     @classmethod
-    async def _get_all_chapters_async(cls, manga_code: str, headless: bool) -> list[dict]:
-        uc = load_nodriver()
-        from pathlib import Path
+    async def _scrape_chapter_rows(cls, page, url: str) -> list[dict]:
+        """
+        Read the paginated chapter list of an already loaded title page.
         
-        url = f"https://comix.to/title/{manga_code}"
-        cookie_file = Path("cf_cookies.dat")
+        Page 1 is read in the tab. When its pagination controls reveal the last
+        page, the remaining pages are fetched concurrently from inside the page
+        and merged by chapter id; pages that cannot be read that way, or lists
+        without recognisable pagination, are walked in the tab instead. If the
+        highest linked page is still a full page of new chapters, the pager
+        was only showing a window and the walk carries on after it.
+        """
+        all_rows = []
+        seen_ids = set()
+        
+        first_rows = await cls._read_list_page(page, url, 1, None)
+        if not first_rows:
+            return all_rows
+        cls._merge_chapter_rows(first_rows, seen_ids, all_rows)
+        
+        last_page = await page.evaluate(_LAST_LIST_PAGE_JS)
+        if not isinstance(last_page, int):
+            await cls._walk_list_pages(page, url, 2, first_rows[0].get("href"), seen_ids, all_rows)
+            return all_rows
+        
+        page_numbers = list(range(2, min(last_page, _MAX_LIST_PAGES) + 1))
+        fetched = await cls._fetch_list_pages(page, [f"{url}?page={n}" for n in page_numbers])
         
-        _browser_lock.acquire()
+        prev_first_href = first_rows[0].get("href")
+        last_rows = first_rows
+        last_added = len(all_rows)
+        for page_n, rows in zip(page_numbers, fetched):
+            if rows is None:
+                logger.debug(f"Chapter list page {page_n} not available via fetch, loading it in the tab")
+                rows = await cls._read_list_page(page, url, page_n, prev_first_href)
+            last_rows = rows or []
+            last_added = 0
+            if rows:
+                prev_first_href = rows[0].get("href")
+                last_added = cls._merge_chapter_rows(rows, seen_ids, all_rows)
+        
+        # A windowed pager (1 2 3 … Next) links only the next few pages. A
+        # full page N that still brought new chapters means the list goes on.
+        last_page = min(last_page, _MAX_LIST_PAGES)
+        if last_added and len(last_rows) >= len(first_rows) and last_page < _MAX_LIST_PAGES:
+            logger.debug(f"Chapter list continues past linked page {last_page}, walking the rest")
+            await cls._walk_list_pages(page, url, last_page + 1, prev_first_href, seen_ids, all_rows)
+        
+        return all_rows
+    
+    @classmethod
+    async def _fetch_list_pages(cls, page, urls: list[str]) -> list[Optional[list[dict]]]:
+        """Fetch and parse chapter list pages concurrently inside the page."""
+        if not urls:
+            return []
         try:
-            browser = await uc.start(
-                headless=headless,
-                browser_args=[
-                    "--start-maximized",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--disable-ipc-flooding-protection",
-                ]
+            results_str = await page.evaluate(
+                f"({_FETCH_LIST_PAGES_JS})({json.dumps(urls)}, {_LIST_FETCH_CONCURRENCY})",
+                await_promise=True,
+                return_by_value=True,
             )
+            if isinstance(results_str, str):
+                return json.loads(results_str)
+            logger.debug(f"Unexpected chapter list fetch result: {results_str}")
+        except Exception as e:
+            logger.debug(f"In-page chapter list fetch failed: {e}")
+        return [None] * len(urls)
+    
+    @staticmethod
+    async def _read_list_page(page, url: str, page_n: int, prev_first_href: Optional[str]) -> list[dict]:
+        """Navigate the tab to one chapter list page and read its rows."""
+        page_url = f"{url}?page={page_n}"
+        if page_n > 1 or page_url != page.url:
+            await page.get(page_url)
             
-            if cookie_file.exists():
-                try:
-                    await browser.cookies.load(str(cookie_file))
-                    logger.info(f"Loaded cookies from {cookie_file}")
-                except Exception as e:
-                    logger.warning(f"Failed loading cookies: {e}")
-        finally:
-            _browser_lock.release()
-                
-        scrape_js = """(() => {
-            const rows = Array.from(document.querySelectorAll('.mchap-item')).map(li => {
-                const a = li.querySelector('.mchap-row__primary');
-                const ch = li.querySelector('.mchap-row__ch');
-                const ti = li.querySelector('.mchap-row__title');
-                const gp = li.querySelector('.mchap-row__group');
-                return {
-                    href: a ? a.getAttribute('href') : null,
-                    chap_label: ch ? ch.textContent.trim() : null,
-                    title: ti ? ti.textContent.trim() : null,
-                    group: gp ? (gp.querySelector('span') ? gp.querySelector('span').textContent.trim() : gp.textContent.trim()) : null,
-                    group_official: gp ? gp.classList.contains('is-official') : false,
-                };
-            });
-            return JSON.stringify(rows);
-        })()"""
-        
-        all_rows = []
-        seen_ids = set()
+        # Wait until rows are there and no longer show the previous page
+        prev_href_js = json.dumps(prev_first_href)
+        rows_str = await _adaptive_wait(
+            page,
+            "chapter_rows",
+            f"(() => {{ const rows = {_CHAPTER_ROWS_JS}; const first = JSON.parse(rows)[0]; "
+            f"return first && ({prev_href_js} === null || first.href !== {prev_href_js}) ? rows : null; }})()",
+            # An empty page ends the list, so a missed learned deadline must not end it early
+            retry=True,
+        )
+        return json.loads(rows_str) if rows_str else []
+    
+    @classmethod
+    async def _walk_list_pages(
+        cls, page, url: str, first_page: int, prev_first_href: Optional[str], seen_ids: set, all_rows: list[dict]
+    ) -> None:
+        """Walk list pages one at a time until rows run out or only repeat."""
+        consecutive_dup_pages = 0
         
-        try:
-            page = await browser.get(url)
-            await page.sleep(5)
+        for page_n in range(first_page, _MAX_LIST_PAGES + 1):
+            rows = await cls._read_list_page(page, url, page_n, prev_first_href)
+            if not rows:
+                break
+                
+            prev_first_href = rows[0].get("href")
             
-            title = await page.evaluate("document.title")
-            if "moment" in title.lower():
-                logger.warning("Cloudflare challenge detected.")
-                if headless:
-                    logger.error("Cannot solve Cloudflare challenge in headless mode. Run with headless=False first.")
-                else:
-                    print("\n[!] Still on the Cloudflare challenge page.")
-                    print("[!] Solve the checkbox manually in the browser window now.")
-                    input("    Press ENTER *after* the page has fully loaded (title changes)...\n")
-                    await page
-                    title = await page.evaluate("document.title")
+            if cls._merge_chapter_rows(rows, seen_ids, all_rows) == 0:
+                consecutive_dup_pages += 1
+                if consecutive_dup_pages >= 2:
+                    break
+            else:
+                consecutive_dup_pages = 0
+    
+    @staticmethod
+    def _merge_chapter_rows(rows: list[dict], seen_ids: set, all_rows: list[dict]) -> int:
+        """Append scraped rows not seen before to all_rows; returns how many were added."""
+        added = 0
+        for row in rows:
+            href = row.get("href")
+            if not href:
+                continue
             
-            prev_first_href = None
-            consecutive_dup_pages = 0
-            max_pages = 200
+            # Parse `/title/{slug}/{chap_id}-chapter-{chap_num}`
+            m = re.match(r".*/title/[^/]+/(\d+)-chapter-(.+)$", href)
+            if not m:
+                continue
             
-            for page_n in range(1, max_pages + 1):
-                page_url = f"{url}?page={page_n}"
-                if page_n > 1 or page_url != page.url:
-                    await page.get(page_url)
-                    
-                rows = []
-                for _ in range(20):
-                    rows_str = await page.evaluate(scrape_js)
-                    rows = json.loads(rows_str) if rows_str else []
-                    if rows:
-                        if prev_first_href is None or rows[0].get("href") != prev_first_href:
-                            break
-                    await page.sleep(0.2)
+            chap_id_str, chap_num_str = m.group(1), m.group(2)
+            if chap_id_str in seen_ids:
+                continue
                 
-                if not rows:
-                    break
-                    
-                prev_first_href = rows[0].get("href")
-                page_added = 0
-                
-                for row in rows:
-                    href = row.get("href")
-                    if not href:
-                        continue
-                    
-                    # Parse `/title/{slug}/{chap_id}-chapter-{chap_num}`
-                    m = re.match(r".*/title/[^/]+/(\d+)-chapter-(.+)$", href)
-                    if not m:
-                        continue
-                    
-                    chap_id_str, chap_num_str = m.group(1), m.group(2)
-                    if chap_id_str in seen_ids:
-                        continue
-                        
-                    seen_ids.add(chap_id_str)
-                    
-                    group = row.get("group")
-                    if not group and row.get("group_official"):
-                        group = "Official"
-                        
-                    all_rows.append({
-                        "chapter_id": int(chap_id_str),
-                        "number": chap_num_str,
-                        "title": row.get("title") or f"Chapter {chap_num_str}",
-                        "group_name": group,
-                    })
-                    page_added += 1
-                    
-                if page_added == 0:
-                    consecutive_dup_pages += 1
-                    if consecutive_dup_pages >= 2:
-                        break
-                else:
-                    consecutive_dup_pages = 0
+            seen_ids.add(chap_id_str)
             
-            if "moment" not in title.lower():
-                _browser_lock.acquire()
-                try:
-                    await browser.cookies.save(str(cookie_file), pattern=".*")
-                    logger.info(f"Saved cookies to {cookie_file}")
-                except Exception as e:
-                    logger.warning(f"Failed saving cookies: {e}")
-                finally:
-                    _browser_lock.release()
+            group = row.get("group")
+            if not group and row.get("group_official"):
+                group = "Official"
                 
-            return all_rows
-        finally:
-            browser.stop()
+            all_rows.append({
+                "chapter_id": int(chap_id_str),
+                "number": chap_num_str,
+                "title": row.get("title") or f"Chapter {chap_num_str}",
+                "group_name": group,
+            })
+            added += 1
+        return added
 
     @classmethod
-    def get_all_chapters(cls, manga_code: str, headless: Optional[bool] = None) -> list[any]:
-        """Fetch all chapters for a manga using nodriver DOM scraping."""
-        from ..core.models import Chapter
-        if headless is None:
-            from ..utils.config import ConfigManager
-            headless = ConfigManager().get("headless", True)
-            
+    async def _get_all_chapters_async(cls, manga_code: str, headless: bool) -> list[dict]:
+        _, rows = await cls._fetch_title_async(manga_code, headless, with_info=False)
+        return rows
+
+    @classmethod
+    async def get_all_chapters_async(cls, manga_code: str, headless: Optional[bool] = None) -> list[any]:
+        """Fetch all chapters for a manga from the API, or by nodriver DOM scraping. Can be awaited from any event loop."""
+        client = cls._api_client()
+        if client is not None:
+            rows = await cls._call_api(f"chapters of {manga_code}", client.get_chapter_rows, manga_code)
+            if rows is not None:
+                chapters = cls._rows_to_chapters(rows)
+                logger.info(f"Found {len(chapters)} chapters using the API")
+                return chapters
+                
+        headless = cls._resolve_headless(headless)
         logger.info(f"Scraping chapters using nodriver (headless={headless}) for {manga_code}...")
         
-        chapters: list[Chapter] = []
+        rows = []
         try:
-            rows = run_async(cls._get_all_chapters_async(manga_code, headless))
-            for row in rows:
-                chapters.append(Chapter(
-                    chapter_id=row["chapter_id"],
-                    number=row["number"],
-                    title=row["title"],
-                    volume=None,
-                    votes=0,
-                    group_name=row["group_name"],
-                    pages_count=0
-                ))
+            rows = await get_event_loop_thread().run_coroutine(cls._get_all_chapters_async(manga_code, headless))
         except Exception as e:
             logger.error(f"nodriver failed to fetch chapters for {manga_code}: {e}")
             
+        chapters = cls._rows_to_chapters(rows)
+        logger.info(f"Found {len(chapters)} chapters using nodriver DOM scraping")
+        return chapters
+
+    @classmethod
+    def get_all_chapters(cls, manga_code: str, headless: Optional[bool] = None) -> list[any]:
+        """Fetch all chapters for a manga from the API, or by nodriver DOM scraping."""
+        return run_async(cls.get_all_chapters_async(manga_code, headless))
+
+    @staticmethod
+    def _rows_to_chapters(rows: list[dict]) -> list[any]:
+        """Convert scraped chapter rows to Chapter objects, oldest first."""
+        from ..core.models import Chapter
+        chapters: list[Chapter] = []
+        for row in rows:
+            chapters.append(Chapter(
+                chapter_id=row["chapter_id"],
+                number=row["number"],
+                title=row["title"],
+                volume=None,
+                votes=0,
+                group_name=row["group_name"],
+                pages_count=0
+            ))
         # Reverse the list so old chapters (low numbers) are at the beginning
         chapters.reverse()
-        logger.info(f"Found {len(chapters)} chapters using nodriver DOM scraping")
         return chapters
-    
+
     @classmethod
-    async def _get_chapter_images_async(
-        cls, chapter_id: int, manga_slug: str, chapter_number: str, headless: bool
-    ) -> tuple[list[str], int]:
-        uc = load_nodriver()
-        from pathlib import Path
+    async def fetch_title_async(cls, manga_code: str, headless: Optional[bool] = None) -> tuple[Optional[any], list[any]]:
+        """
+        Fetch manga info and all chapters, from the API where possible and
+        otherwise from a single title page load.
+        Can be awaited from any event loop.
         
-        chapter_url = f"https://comix.to/title/{manga_slug}/{chapter_id}-chapter-{chapter_number}"
-        cookie_file = Path("cf_cookies.dat")
+        Returns:
+            Tuple of (MangaInfo or None, chapters)
+        """
+        manga_detail = None
+        rows = None
+        client = cls._api_client()
+        if client is not None:
+            manga_detail, rows = await asyncio.gather(
+                cls._call_api(f"manga {manga_code}", client.get_manga, manga_code),
+                cls._call_api(f"chapters of {manga_code}", client.get_chapter_rows, manga_code),
+            )
+            if manga_detail is not None and rows is not None:
+                chapters = cls._rows_to_chapters(rows)
+                logger.info(f"Found {len(chapters)} chapters using the API")
+                return cls._manga_detail_to_info(manga_detail), chapters
+        
+        headless = cls._resolve_headless(headless)
+        logger.info(f"Fetching title page using nodriver (headless={headless}) for {manga_code}...")
         
-        _browser_lock.acquire()
         try:
-            browser = await uc.start(
-                headless=headless,
-                browser_args=[
-                    "--start-maximized",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--disable-ipc-flooding-protection",
-                ]
+            # Only scrape what the API could not provide
+            initial_data_str, scraped_rows = await get_event_loop_thread().run_coroutine(
+                cls._fetch_title_async(
+                    manga_code, headless, with_info=manga_detail is None, with_chapters=rows is None
+                )
             )
+        except Exception as e:
+            logger.error(f"nodriver failed to fetch title {manga_code}: {e}")
+            return None, []
             
-            if cookie_file.exists():
-                try:
-                    await browser.cookies.load(str(cookie_file))
-                    logger.info(f"Loaded cookies from {cookie_file}")
-                except Exception as e:
-                    logger.warning(f"Failed loading cookies: {e}")
-        finally:
-            _browser_lock.release()
+        if rows is None:
+            rows = scraped_rows
+        manga = cls._manga_detail_to_info(manga_detail) if manga_detail is not None else None
+        if initial_data_str:
+            try:
+                manga = cls._parse_manga_info(json.loads(initial_data_str), manga_code)
+            except Exception as e:
+                logger.error(f"Failed to parse manga info for {manga_code}: {e}")
                 
-        image_urls = []
-        page_count = 0
-        
-        try:
-            # Setup init script to backup original toDataURL and set localStorage reader.default preload config
-            page = browser.main_tab
+        chapters = cls._rows_to_chapters(rows)
+        logger.info(f"Found {len(chapters)} chapters using nodriver DOM scraping")
+        return manga, chapters
+
+    @classmethod
+    def fetch_title(cls, manga_code: str, headless: Optional[bool] = None) -> tuple[Optional[any], list[any]]:
+        """Fetch manga info and all chapters, from the API or a single title page load."""
+        return run_async(cls.fetch_title_async(manga_code, headless))
+    
+    @staticmethod
+    async def _prepare_reader_tab(tab) -> None:
+        """
+        Setup init script to backup original toDataURL/toBlob/createImageBitmap/getImageData,
+        set localStorage reader.default preload config and install the window.__comix extraction runtime.
+        Pooled tabs are reused, so the script is only registered once per tab.
+        """
+        if not getattr(tab, "_comix_init_installed", False):
             try:
                 cdp_page = load_cdp_page()
-                await page.send(cdp_page.enable())
+                await tab.send(cdp_page.enable())
                 init_js = """
                 try {
                     window.__origToDataURL = HTMLCanvasElement.prototype.toDataURL;
+                    window.__origToBlob = HTMLCanvasElement.prototype.toBlob;
+                    window.__origCreateImageBitmap = window.createImageBitmap;
+                    window.__origGetImageData = CanvasRenderingContext2D.prototype.getImageData;
                     const k = 'reader.default';
                     const cur = JSON.parse(localStorage.getItem(k) || '{}');
                     cur.preload = 'all';
                     localStorage.setItem(k, JSON.stringify(cur));
                 } catch (e) {}
-                """
-                await page.send(cdp_page.add_script_to_evaluate_on_new_document(source=init_js))
+                """ + _READER_RUNTIME_JS
+                await tab.send(cdp_page.add_script_to_evaluate_on_new_document(source=init_js))
+                tab._comix_init_installed = True
             except Exception as e:
                 logger.warning(f"Failed to setup page init script: {e}")
-                
-            # Now navigate directly to chapter page
-            page = await browser.get(chapter_url)
+
+    @classmethod
+    async def _get_chapter_images_async(
+        cls, chapter_id: int, manga_slug: str, chapter_number: str, headless: bool,
+        extraction_mode: str = "batched", capture_mode: str = "canvas",
+        image_mime: str = "image/webp", image_quality: float = 0.95, config: Any = None
+    ) -> tuple[list[str | bytes], int]:
+        page_count = 0
+        
+        def set_page_count(count: int) -> None:
+            nonlocal page_count
+            page_count = count
             
-            # Wait for reader page elements to load OR Cloudflare challenge
-            cloudflare_detected = False
-            for _ in range(150):
-                try:
-                    title = await page.evaluate("document.title") or ""
-                    if "moment" in title.lower():
-                        cloudflare_detected = True
-                        break
-                    page_count = await page.evaluate("document.querySelectorAll('.rpage-page').length") or 0
-                    if page_count > 0:
-                        break
-                except Exception:
-                    pass
-                await page.sleep(0.2)
+        pages = [
+            item async for item in cls._stream_chapter_async(
+                chapter_id, manga_slug, chapter_number, headless, extraction_mode, capture_mode,
+                image_mime, image_quality, config, on_page_count=set_page_count
+            )
+        ]
+        return [image for _, image in sorted(pages, key=lambda p: p[0])], page_count
+
+    @classmethod
+    async def _stream_chapter_async(
+        cls, chapter_id: int, manga_slug: str, chapter_number: str, headless: bool,
+        extraction_mode: str = "batched", capture_mode: str = "canvas",
+        image_mime: str = "image/webp", image_quality: float = 0.95, config: Any = None,
+        on_page_count: Optional[Callable[[int], None]] = None, affinity: Optional[Hashable] = None
+    ) -> AsyncIterator[tuple[int, str | bytes]]:
+        """
+        Yield (page_number, url_or_bytes) for each page of a chapter as soon as it is extracted.
+        
+        Must run on the shared event loop. If the tab hangs and the chapter is
+        re-queued, pages that were already yielded are not yielded again.
+        Chapters streamed with the same affinity key reuse one tab where possible.
+        config is the ConfigManager the caller already loaded for this chapter.
+        """
+        if config is None:
+            from ..utils.config import ConfigManager
+            config = ConfigManager()
+        in_reader_navigation = config.get("in_reader_navigation", True)
+        chapter_url = f"https://comix.to/title/{manga_slug}/{chapter_id}-chapter-{chapter_number}"
+        ready: asyncio.Queue = asyncio.Queue()
+        seen: set[int] = set()
+        done = object()
+        
+        async def work(tab) -> None:
+            await cls._prepare_reader_tab(tab)
             
-            if cloudflare_detected:
-                logger.warning("Cloudflare challenge detected.")
-                if headless:
-                    logger.error("Cannot solve Cloudflare challenge in headless mode. Run with headless=False first.")
-                    return [], 0
+            blocker = ResourceBlocker.from_config(tab, config=config)
+            if blocker is not None:
+                await blocker.start()
+            # Opt-in: keep the original bytes of image responses so <img> pages need no second fetch
+            capture = NetworkCapture(tab) if capture_mode == "network" else None
+            if capture is not None:
+                await capture.start()
+            try:
+                async for page_num, image in cls._iter_chapter(
+                    tab, chapter_url, headless, extraction_mode, capture, image_mime, image_quality, on_page_count,
+                    in_reader_navigation
+                ):
+                    if page_num not in seen:
+                        seen.add(page_num)
+                        ready.put_nowait((page_num, image))
+            finally:
+                if capture is not None:
+                    await capture.stop()
+                if blocker is not None:
+                    await blocker.stop()
+        
+        # A hung tab is closed and the chapter started over on a fresh one
+        task = asyncio.ensure_future(get_browser_pool(headless).supervise(work, affinity=affinity))
+        task.add_done_callback(lambda _: ready.put_nowait(done))
+        try:
+            while (item := await ready.get()) is not done:
+                yield item
+            task.result()
+        finally:
+            task.cancel()
+
+    @classmethod
+    async def _iter_chapter(
+        cls, tab, chapter_url: str, headless: bool, extraction_mode: str, capture: Optional[NetworkCapture],
+        image_mime: str, image_quality: float, on_page_count: Optional[Callable[[int], None]] = None,
+        in_reader_navigation: bool = True
+    ) -> AsyncIterator[tuple[int, str | bytes]]:
+        """Load a chapter in a prepared tab and yield every page as it is extracted."""
+        page_count = 0
+        
+        page = await cls._open_chapter(tab, chapter_url, in_reader_navigation)
+        
+        # Wait for reader page elements to load OR Cloudflare challenge
+        title = ""
+        cloudflare_detected = False
+        state = await _adaptive_wait(
+            page,
+            "reader_ready",
+            "document.title.toLowerCase().includes('moment') ? {cloudflare: true} : "
+            "(document.querySelectorAll('.rpage-page').length ? {pages: document.querySelectorAll('.rpage-page').length} : null)",
+            retry=True,
+        )
+        if state and state.get("cloudflare"):
+            cloudflare_detected = True
+            title = "moment"
+        elif state:
+            page_count = state.get("pages", 0)
+        
+        if cloudflare_detected:
+            logger.warning("Cloudflare challenge detected.")
+            if headless:
+                logger.error("Cannot solve Cloudflare challenge in headless mode. Run with headless=False first.")
+                return
+            else:
+                print("\n[!] Still on the Cloudflare challenge page.")
+                print("[!] Solve the checkbox manually in the browser window now.")
+                await asyncio.get_running_loop().run_in_executor(
+                    None, input, "    Press ENTER *after* the page has fully loaded (title changes)...\n"
+                )
+                await page
+                title = await page.evaluate("document.title") or ""
+                # Re-verify page count after manual solving
+                page_count = await _wait_for(
+                    page, "document.querySelectorAll('.rpage-page').length", _PAGE_READY_TIMEOUT_MS / 1000
+                ) or 0
+            
+        if page_count == 0:
+            logger.error(f"Chapter page had no pages in DOM: {chapter_url}")
+            return
+        if on_page_count is not None:
+            on_page_count(page_count)
+            
+        # Wait for first page to begin rendering
+        await _adaptive_wait(
+            page,
+            "first_page",
+            "document.querySelector('.rpage-page[data-page=\"1\"] canvas, .rpage-page[data-page=\"1\"] img') ? true : false",
+        )
+            
+        logger.info(f"Chapter has {page_count} pages. Extracting content...")
+        await _ensure_runtime(page)
+        
+        if extraction_mode == "sequential":
+            pages = cls._iter_pages_sequential(page, page_count, image_mime, image_quality)
+        elif extraction_mode == "viewport":
+            pages = cls._iter_pages_viewport(page, page_count, image_mime, image_quality)
+        else:
+            pages = cls._iter_pages_batched(page, page_count, image_mime, image_quality)
+            
+        async for page_num, image in pages:
+            if capture is not None and isinstance(image, str) and image.startswith("http"):
+                # Plain image pages: use the bytes the reader already downloaded
+                image = await capture.take(image) or image
+            yield page_num, image
+        
+        if "moment" not in title.lower():
+            await _sync_browser_state(tab)
+        # Lets the next chapter of this series move here in-app
+        tab._comix_reader_url = chapter_url
+            
+        logger.debug(f"Wait latencies: {get_latency_tracker().summary()}")
+
+    @classmethod
+    async def _open_chapter(cls, tab, chapter_url: str, in_reader_navigation: bool = True):
+        """
+        Open a chapter in the tab, moving in-app from the previous chapter of
+        the same series when the tab still shows its reader.
+        
+        The in-app move skips the cold load of the app shell and keeps the
+        reader (and its decrypt and encoder workers) warm. Any failure falls
+        back to a full navigation.
+        """
+        previous = getattr(tab, "_comix_reader_url", None)
+        tab._comix_reader_url = None
+        
+        path = urlparse(chapter_url).path
+        same_series = previous and urlparse(previous).path.rsplit("/", 1)[0] == path.rsplit("/", 1)[0]
+        if same_series and in_reader_navigation:
+            try:
+                if await _runtime_call(tab, f"window.__comix.navigate({json.dumps(path)})", await_promise=False):
+                    if await _wait_for(tab, f"window.__comix.landed({json.dumps(path)})", _READER_NAVIGATION_TIMEOUT):
+                        logger.debug(f"Moved to {path} inside the reader")
+                        return tab
+                    logger.debug(f"In-reader move to {path} did not land, loading it")
                 else:
-                    print("\n[!] Still on the Cloudflare challenge page.")
-                    print("[!] Solve the checkbox manually in the browser window now.")
-                    input("    Press ENTER *after* the page has fully loaded (title changes)...\n")
-                    await page
-                    # Re-verify page count after manual solving
-                    for _ in range(150):
-                        try:
-                            page_count = await page.evaluate("document.querySelectorAll('.rpage-page').length") or 0
-                            if page_count > 0:
-                                break
-                        except Exception:
-                            pass
-                        await page.sleep(0.2)
-                
-            if page_count == 0:
-                logger.error(f"Chapter page had no pages in DOM: {chapter_url}")
-                return [], 0
+                    logger.debug(f"No reader link to {path}, loading it")
+            except Exception as e:
+                logger.debug(f"In-reader move to {path} failed: {e}")
                 
-            # Wait for first page to begin rendering
-            for _ in range(150):
-                try:
-                    first_ready = await page.evaluate(
-                        "document.querySelector('.rpage-page[data-page=\"1\"] canvas, .rpage-page[data-page=\"1\"] img') ? true : false"
-                    )
-                    if first_ready:
-                        break
-                except Exception:
-                    pass
-                await page.sleep(0.2)
+        return await tab.get(chapter_url)
+
+    @classmethod
+    async def _iter_pages_batched(
+        cls, page, page_count: int, image_mime: str, image_quality: float, batch_size: int = 10
+    ) -> AsyncIterator[tuple[int, str | bytes]]:
+        """
+        Extract pages with one in-page async routine per batch, yielding (page_number, image).
+        
+        The routine scrolls each page into view and waits for its readiness
+        inside the page, so a batch of pages costs a single CDP round trip.
+        Canvas pages come back as raw bytes in image_mime, image pages as their URL.
+        
+        The per-page deadline is learned from earlier renders; a page that
+        misses it is retried alone with the full budget. If a whole batch
+        call fails (context destroyed, runtime missing), its pages are
+        extracted one at a time with the full budget; an error there ends
+        the chapter rather than silently dropping pages.
+        """
+        tracker = get_latency_tracker()
+        default, floor = _WAIT_BUDGETS["page_render"]
+        timeout = tracker.deadline("page_render", default, floor)
+        tick_ms = tracker.poll_interval_ms("page_render")
+        
+        for first in range(1, page_count + 1, batch_size):
+            last = min(first + batch_size - 1, page_count)
+            page_timeout = timeout
+            try:
+                results = await cls._run_extract_batch(page, first, last, timeout, image_mime, image_quality, tick_ms)
+            except Exception as e:
+                logger.warning(f"Pages {first}-{last} batch extraction failed, extracting them one by one: {e}")
+                await _ensure_runtime(page)
+                page_timeout = default
+                results = [
+                    (await cls._run_extract_batch(page, n, n, default, image_mime, image_quality, tick_ms))[0]
+                    for n in range(first, last + 1)
+                ]
                 
-            logger.info(f"Chapter has {page_count} pages. Extracting content...")
-            
-            for page_num in range(1, page_count + 1):
-                # Scroll page element into view to trigger render/decryption
-                try:
-                    await page.evaluate(
-                        f"(() => {{ const el = document.querySelector('.rpage-page[data-page=\"{page_num}\"]'); if (el) el.scrollIntoView({{behavior: 'instant', block: 'center'}}); }})()"
-                    )
-                except Exception:
-                    pass
+            for page_num, res in enumerate(results, first):
+                if res.get("type") == "timeout":
+                    tracker.record_timeout("page_render")
+                    if page_timeout < default:
+                        logger.debug(f"Page {page_num} missed the {timeout:.1f}s learned deadline, retrying")
+                        try:
+                            res = (await cls._run_extract_batch(
+                                page, page_num, page_num, default, image_mime, image_quality, tick_ms
+                            ))[0]
+                        except Exception as e:
+                            logger.debug(f"Page {page_num} retry failed: {e}")
+                if "ms" in res:
+                    tracker.record("page_render", res["ms"] / 1000)
                     
-                # Wait for image element or canvas element to be ready
-                ready = None
-                for _attempt in range(150):
+                image = await cls._page_result(page, page_num, res)
+                if image is not None:
+                    yield page_num, image
+
+    @staticmethod
+    async def _page_result(page, page_num: int, res: dict) -> Optional[str | bytes]:
+        """Turn one in-page extractor result into image bytes or a URL; None if the page yields nothing."""
+        res_type = res.get("type")
+        if res_type == "blob":
+            try:
+                return await _take_blob(page, page_num)
+            except Exception as e:
+                logger.error(f"Page {page_num} blob transfer failed: {e}")
+        elif res_type == "img":
+            return res.get("src")
+        elif res_type == "skip":
+            how = "pixel sample" if res.get("sampled") else "size"
+            logger.debug(f"Page {page_num} is an ad/placeholder page ({how}). Skipping.")
+        elif res_type == "timeout":
+            logger.error(f"Page {page_num} timed out waiting for render.")
+        elif res_type == "error":
+            logger.error(f"Page {page_num} failed to encode: {res.get('error')}")
+        else:
+            logger.error(f"Page {page_num} failed to extract valid URL or data: {res}")
+        return None
+
+    @classmethod
+    async def _iter_pages_viewport(
+        cls, page, page_count: int, image_mime: str, image_quality: float
+    ) -> AsyncIterator[tuple[int, str | bytes]]:
+        """
+        Extract pages under a tall emulated viewport, yielding (page_number, image) as each finishes.
+        
+        Every page inside the viewport is rendered and decrypted by the reader
+        at the same time; each harvest round trip collects whichever pages are
+        ready, in any order. Once a window is drained the next unfinished page
+        is scrolled to the top. Pages that miss the window deadline are retried
+        alone with the batched extractor.
+        """
+        cdp_emulation = load_cdp_module("emulation")
+        tracker = get_latency_tracker()
+        default, floor = _WAIT_BUDGETS["viewport_window"]
+        timeout = tracker.deadline("viewport_window", default, floor)
+        tick_ms = tracker.poll_interval_ms("page_render")
+        
+        await page.send(cdp_emulation.set_device_metrics_override(
+            width=_TALL_VIEWPORT_WIDTH, height=_TALL_VIEWPORT_HEIGHT, device_scale_factor=1, mobile=False
+        ))
+        try:
+            remaining = list(range(1, page_count + 1))
+            while remaining:
+                await _runtime_call(page, f"window.__comix.scrollTo({remaining[0]}, 'start')", await_promise=False)
+                visible = await _runtime_call(page, f"window.__comix.visible({json.dumps(remaining)})", await_promise=False)
+                window = set(visible or []) or {remaining[0]}
+                logger.debug(f"Rendering pages {min(window)}-{max(window)} in one viewport")
+                
+                start = time.monotonic()
+                while window:
+                    left = timeout - (time.monotonic() - start)
+                    if left <= 0:
+                        break
                     try:
-                        ready_res = await page.evaluate(
-                            f"""(() => {{
-                                const el = document.querySelector('.rpage-page[data-page="{page_num}"]');
-                                if (!el) return null;
-                                const isLoading = el.classList.contains('is-loading');
-                                
-                                // Check canvas
-                                const c = el.querySelector('canvas');
-                                if (c && c.width > 10 && c.height > 10) {{
-                                    if (isLoading) return null; // Wait if still loading
-                                    const toDataURL = window.__origToDataURL || c.toDataURL;
-                                    const data = toDataURL.call(c, 'image/webp', 0.95);
-                                    if (data.length < 20000) {{
-                                        return JSON.stringify({{type: 'skip'}}); // Blank/Ad canvas
-                                    }}
-                                    return JSON.stringify({{type: 'canvas_data', data: data}});
-                                }}
-                                
-                                // Check image
-                                const i = el.querySelector('img');
-                                if (i && i.src) {{
-                                    if (i.complete) {{
-                                        if (i.naturalWidth > 10 && i.naturalHeight > 10) {{
-                                            return JSON.stringify({{type: 'img', src: i.src}});
-                                        }}
-                                        if (i.naturalWidth > 0 && i.naturalWidth <= 10) {{
-                                            return JSON.stringify({{type: 'skip'}}); // 1x1 placeholder
-                                        }}
-                                    }}
-                                }}
-                                return null;
-                            }})()"""
-                        )
-                        ready = json.loads(ready_res) if ready_res else None
-                    except Exception:
-                        ready = None
-                    if ready:
+                        results = await cls._run_harvest(page, sorted(window), left, image_mime, image_quality, tick_ms)
+                    except Exception as e:
+                        logger.error(f"Harvesting pages {min(window)}-{max(window)} failed: {e}")
                         break
-                    await page.sleep(0.2)
-                    
-                if not ready:
-                    logger.error(f"Page {page_num} timed out waiting for render.")
-                    continue
-                    
-                if ready.get('type') == 'skip':
-                    logger.debug(f"Page {page_num} is an ad/placeholder page. Skipping.")
-                    continue
-                    
-                if ready.get('type') == 'canvas_data':
-                    image_urls.append(ready.get('data'))
-                    continue
-                    
-                # Extract image data or URL from image
-                try:
-                    extracted_url = await page.evaluate(
-                        f"""(() => {{
-                            try {{
-                                const el = document.querySelector('.rpage-page[data-page="{page_num}"]');
-                                if (!el) return null;
-                                
-                                const c = el.querySelector('canvas');
-                                if (c && c.width > 0 && c.height > 0) {{
-                                    const toDataURL = window.__origToDataURL || c.toDataURL;
-                                    return toDataURL.call(c, 'image/webp', 0.95);
-                                }}
-                                
-                                const i = el.querySelector('img');
-                                if (i && i.src) {{
-                                    if (i.src.startsWith('blob:')) {{
-                                        try {{
-                                            const canvas = document.createElement('canvas');
-                                            canvas.width = i.naturalWidth || i.width;
-                                            canvas.height = i.naturalHeight || i.height;
-                                            const ctx = canvas.getContext('2d');
-                                            ctx.drawImage(i, 0, 0);
-                                            const toDataURL = window.__origToDataURL || canvas.toDataURL;
-                                            return toDataURL.call(canvas, 'image/webp', 0.95);
-                                        }} catch (e) {{
-                                            return null;
-                                        }}
-                                    }}
-                                    return i.src;
-                                }}
-                                return null;
-                            }} catch (e) {{
-                                return null;
-                            }}
-                        }})()"""
-                    )
-                except Exception as e:
-                    logger.error(f"Page {page_num} extraction failed: {e}")
-                    continue
-                    
-                if extracted_url:
-                    image_urls.append(extracted_url)
-                else:
-                    logger.error(f"Page {page_num} failed to extract valid URL or data.")
-            
-            if "moment" not in title.lower():
-                _browser_lock.acquire()
-                try:
-                    await browser.cookies.save(str(cookie_file), pattern=".*")
-                    logger.info(f"Saved cookies to {cookie_file}")
-                except Exception as e:
-                    logger.warning(f"Failed saving cookies: {e}")
-                finally:
-                    _browser_lock.release()
+                    if not results:
+                        break
+                    for res in results:
+                        page_num = res.get("page")
+                        if page_num not in window:
+                            continue
+                        window.discard(page_num)
+                        remaining.remove(page_num)
+                        image = await cls._page_result(page, page_num, res)
+                        if image is not None:
+                            yield page_num, image
+                    if not window:
+                        tracker.record("viewport_window", time.monotonic() - start)
                 
-            return image_urls, page_count
+                # Stragglers get the sequential treatment with the full budget
+                if window:
+                    tracker.record_timeout("viewport_window")
+                for page_num in sorted(window):
+                    remaining.remove(page_num)
+                    try:
+                        res = (await cls._run_extract_batch(
+                            page, page_num, page_num, _WAIT_BUDGETS["page_render"][0], image_mime, image_quality, tick_ms
+                        ))[0]
+                    except Exception as e:
+                        logger.error(f"Page {page_num} extraction failed: {e}")
+                        continue
+                    image = await cls._page_result(page, page_num, res)
+                    if image is not None:
+                        yield page_num, image
         finally:
-            browser.stop()
+            # Tabs are pooled; the next user gets the normal viewport back
+            try:
+                await page.send(cdp_emulation.clear_device_metrics_override())
+            except Exception as e:
+                logger.debug(f"Failed to clear viewport override: {e}")
+
+    @staticmethod
+    async def _run_harvest(
+        page, pending: list[int], timeout: float, image_mime: str, image_quality: float, tick_ms: int
+    ) -> list[dict]:
+        """Collect whichever pending pages are ready, waiting up to timeout for the first one."""
+        return await _runtime_call(
+            page,
+            f"window.__comix.harvest({json.dumps(pending)}, {int(timeout * 1000)}, "
+            f"{json.dumps(image_mime)}, {image_quality}, {tick_ms})",
+        )
+
+    @staticmethod
+    async def _run_extract_batch(
+        page, first: int, last: int, timeout: float, image_mime: str, image_quality: float, tick_ms: int
+    ) -> list[dict]:
+        """Run the in-page batch extractor for pages [first, last] and return its per-page results."""
+        return await _runtime_call(
+            page,
+            f"window.__comix.extractBatch({first}, {last}, {int(timeout * 1000)}, "
+            f"{json.dumps(image_mime)}, {image_quality}, {tick_ms})",
+        )
 
     @classmethod
-    def get_chapter_images(cls, chapter_id: int, manga_slug: str = None, chapter_number: str = None, headless: Optional[bool] = None) -> list[str]:
-        """Fetch all image URLs / data URLs for a chapter using nodriver."""
-        if headless is None:
-            from ..utils.config import ConfigManager
-            headless = ConfigManager().get("headless", True)
+    async def _iter_pages_sequential(
+        cls, page, page_count: int, image_mime: str, image_quality: float
+    ) -> AsyncIterator[tuple[int, str | bytes]]:
+        """Extract pages one by one with a few CDP round trips per page, yielding (page_number, image)."""
+        for page_num in range(1, page_count + 1):
+            # Scroll page element into view to trigger render/decryption
+            try:
+                await _runtime_call(page, f"window.__comix.scrollTo({page_num})", await_promise=False)
+            except Exception:
+                pass
+                
+            ready = await _adaptive_wait(page, "page_render", f"window.__comix.ready({page_num})", retry=True)
+            if not ready:
+                logger.error(f"Page {page_num} timed out waiting for render.")
+                continue
+                
+            try:
+                res = await _runtime_call(
+                    page, f"window.__comix.extract({page_num}, {json.dumps(image_mime)}, {image_quality})"
+                )
+            except Exception as e:
+                logger.error(f"Page {page_num} extraction failed: {e}")
+                continue
+                
+            image = await cls._page_result(page, page_num, res)
+            if image is not None:
+                yield page_num, image
+
+    @classmethod
+    async def _chapter_images_from_api(cls, chapter_id: int, config: Any) -> Optional[list[str]]:
+        """Image URLs from the API when api_chapter_images is on, else None."""
+        # Opt-in: the reader may descramble pages on canvas, which raw API URLs skip
+        client = cls._api_client(config) if config.get("api_chapter_images", False) else None
+        if client is None:
+            return None
+        image_urls = await cls._call_api(f"chapter {chapter_id}", client.get_chapter_images, chapter_id)
+        if image_urls:
+            logger.info(f"Retrieved {len(image_urls)} page URLs using the API.")
+        return image_urls or None
+
+    @classmethod
+    def _browser_chapter_args(
+        cls, chapter_id: int, manga_slug: Optional[str], chapter_number: Optional[str], headless: Optional[bool],
+        image_encoding: str, image_quality: float, config: Any
+    ) -> tuple:
+        """Resolve defaults and config into the arguments of a browser extraction."""
+        headless = cls._resolve_headless(headless, config)
             
         if not manga_slug or not chapter_number:
             manga_slug = "manga"
@@ -606,12 +1537,97 @@ class ComixAPI:
         chapter_url = f"https://comix.to/title/{manga_slug}/{chapter_id}-chapter-{chapter_number}"
         logger.info(f"Fetching chapter images via nodriver DOM (headless={headless}) for {chapter_url}...")
         
+        return (
+            chapter_id, manga_slug, chapter_number, headless,
+            config.get("extraction_mode", "batched"), config.get("capture_mode", "canvas"),
+            f"image/{image_encoding}", image_quality, config,
+        )
+
+    @classmethod
+    async def get_chapter_images_async(
+        cls, chapter_id: int, manga_slug: str = None, chapter_number: str = None, headless: Optional[bool] = None,
+        image_encoding: str = "webp", image_quality: float = 0.95
+    ) -> list[str | bytes]:
+        """
+        Fetch all image URLs, data URLs or raw image bytes for a chapter using nodriver. Can be awaited from any event loop.
+        
+        Canvas pages are encoded in the browser as image_encoding (jpeg, webp or png);
+        pick the encoding the output format stores so the bytes need no re-encoding.
+        """
+        from ..utils.config import ConfigManager
+        # Read once; every setting of this extraction comes from here
+        config = ConfigManager()
+        image_urls = await cls._chapter_images_from_api(chapter_id, config)
+        if image_urls:
+            return image_urls
+                
+        args = cls._browser_chapter_args(
+            chapter_id, manga_slug, chapter_number, headless, image_encoding, image_quality, config
+        )
+        
         image_urls = []
         page_count = 0
         try:
-            image_urls, page_count = run_async(cls._get_chapter_images_async(chapter_id, manga_slug, chapter_number, headless))
+            image_urls, page_count = await get_event_loop_thread().run_coroutine(cls._get_chapter_images_async(*args))
         except Exception as e:
             logger.error(f"nodriver failed to fetch images for chapter {chapter_id}: {e}")
             
         logger.info(f"Retrieved {len(image_urls)} / {page_count} page images.")
         return image_urls
+
+    @classmethod
+    def get_chapter_images(
+        cls, chapter_id: int, manga_slug: str = None, chapter_number: str = None, headless: Optional[bool] = None,
+        image_encoding: str = "webp", image_quality: float = 0.95
+    ) -> list[str | bytes]:
+        """Fetch all image URLs, data URLs or raw image bytes for a chapter using nodriver."""
+        return run_async(cls.get_chapter_images_async(
+            chapter_id, manga_slug, chapter_number, headless, image_encoding, image_quality
+        ))
+
+    @classmethod
+    def stream_chapter_images(
+        cls, chapter_id: int, manga_slug: str = None, chapter_number: str = None, headless: Optional[bool] = None,
+        image_encoding: str = "webp", image_quality: float = 0.95,
+        on_page_count: Optional[Callable[[int], None]] = None, affinity: Optional[Hashable] = None
+    ) -> Iterator[tuple[int, str | bytes]]:
+        """
+        Yield (page_number, url_or_bytes) for a chapter as each page is extracted.
+        
+        Callers can download the first pages while the browser still renders
+        later ones. Page numbers follow the reader, so skipped ad pages leave
+        gaps. on_page_count is called once the number of reader pages is known.
+        Consecutive chapters streamed in order with the same affinity key stay
+        on one tab and move between each other inside the reader.
+        
+        Raises:
+            Whatever stopped the extraction early (a tab that kept hanging, a
+            browser that died), after any pages yielded before it, so a
+            partial chapter is not mistaken for a complete one
+        """
+        from ..utils.config import ConfigManager
+        # Read once; every setting of this extraction comes from here
+        config = ConfigManager()
+        image_urls = run_async(cls._chapter_images_from_api(chapter_id, config))
+        if image_urls:
+            if on_page_count is not None:
+                on_page_count(len(image_urls))
+            yield from enumerate(image_urls, 1)
+            return
+        
+        args = cls._browser_chapter_args(
+            chapter_id, manga_slug, chapter_number, headless, image_encoding, image_quality, config
+        )
+        
+        count = 0
+        try:
+            for page_num, image in get_event_loop_thread().iterate(
+                cls._stream_chapter_async(*args, on_page_count=on_page_count, affinity=affinity)
+            ):
+                count += 1
+                yield page_num, image
+        except Exception as e:
+            logger.error(f"nodriver failed after {count} page images of chapter {chapter_id}: {e}")
+            raise
+            
+        logger.info(f"Streamed {count} page images.")
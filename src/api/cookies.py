@@ -0,0 +1,161 @@
+"""
+Process-wide cookie store shared by every pooled browser.
+
+Cookies are read from disk once, handed to each browser through CDP, and
+written back only when a visit actually changed them. All access happens on
+the shared event loop, so no lock is needed.
+"""
+
+import pickle
+import time
+from pathlib import Path
+from typing import Optional
+from ..utils.logger import get_logger
+from ..utils.nodriver_compat import load_cdp_module
+from ..utils.session import CLEARANCE_COOKIE
+
+logger = get_logger(__name__)
+
+COOKIE_FILE = Path("cf_cookies.dat")
+
+
+class CookieStore:
+    """In-memory cookie jar kept in sync with the browsers and cf_cookies.dat."""
+
+    def __init__(self, path: str | Path = COOKIE_FILE):
+        self.path = Path(path)
+        self.version = 0
+        self._cookies: dict[tuple[str, str, str], object] = {}
+        self._loaded = False
+
+    @staticmethod
+    def _key(cookie) -> tuple[str, str, str]:
+        return cookie.name, cookie.domain, cookie.path
+
+    @staticmethod
+    def _is_expired(cookie, now: float) -> bool:
+        # Session cookies carry expires -1
+        return not cookie.session and cookie.expires is not None and 0 < cookie.expires <= now
+
+    def load(self) -> None:
+        """Read the cookie file; later calls are no-ops."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "rb") as f:
+                cookies = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed loading cookies: {e}")
+            return
+
+        now = time.time()
+        for cookie in cookies:
+            if not self._is_expired(cookie, now):
+                self._cookies[self._key(cookie)] = cookie
+        self.version += 1
+        logger.info(f"Loaded {len(self._cookies)} cookies from {self.path}")
+
+        expires = self.clearance_expires()
+        if expires is None:
+            logger.debug("No valid Cloudflare clearance cookie stored")
+        else:
+            logger.debug(f"Cloudflare clearance valid for {int(expires - now)}s")
+
+    def save(self) -> None:
+        """Write the cookies to disk, replacing the file atomically."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(list(self._cookies.values()), f)
+            tmp_path.replace(self.path)
+            logger.info(f"Saved cookies to {self.path}")
+        except Exception as e:
+            logger.warning(f"Failed saving cookies: {e}")
+
+    @property
+    def cookies(self) -> list:
+        """Stored cookies that have not expired."""
+        self.load()
+        now = time.time()
+        return [c for c in self._cookies.values() if not self._is_expired(c, now)]
+
+    def clearance_expires(self) -> Optional[float]:
+        """Epoch time the latest cf_clearance cookie expires, or None without one."""
+        now = time.time()
+        expiries = [
+            c.expires for c in self._cookies.values()
+            if c.name == CLEARANCE_COOKIE and not self._is_expired(c, now) and c.expires and c.expires > 0
+        ]
+        return max(expiries) if expiries else None
+
+    async def inject(self, connection) -> None:
+        """Set the stored cookies in a browser through one of its tabs."""
+        cookies = self.cookies
+        if not cookies:
+            return
+        cdp_network = load_cdp_module("network")
+        cdp_storage = load_cdp_module("storage")
+        params = [
+            cdp_network.CookieParam(
+                name=c.name,
+                value=c.value,
+                domain=c.domain,
+                path=c.path,
+                secure=c.secure,
+                http_only=c.http_only,
+                same_site=c.same_site,
+                expires=None if c.session else cdp_network.TimeSinceEpoch(c.expires),
+                priority=c.priority,
+                source_scheme=c.source_scheme,
+                source_port=c.source_port,
+                partition_key=c.partition_key,
+            )
+            for c in cookies
+        ]
+        try:
+            await connection.send(cdp_storage.set_cookies(params))
+        except Exception as e:
+            logger.warning(f"Failed injecting cookies: {e}")
+
+    async def update_from(self, connection) -> bool:
+        """
+        Merge a browser's current cookies into the store.
+
+        Returns:
+            True if anything changed (and the file was rewritten)
+        """
+        self.load()
+        cdp_storage = load_cdp_module("storage")
+        try:
+            cookies = await connection.send(cdp_storage.get_cookies())
+        except Exception as e:
+            logger.warning(f"Failed reading browser cookies: {e}")
+            return False
+
+        changed = False
+        for cookie in cookies:
+            key = self._key(cookie)
+            known = self._cookies.get(key)
+            if known is None or known.value != cookie.value:
+                changed = True
+            self._cookies[key] = cookie
+
+        if changed:
+            self.version += 1
+            self.save()
+        return changed
+
+
+_store: Optional[CookieStore] = None
+
+
+def get_cookie_store() -> CookieStore:
+    """Get the shared cookie store, loading it on first use."""
+    global _store
+    if _store is None:
+        _store = CookieStore()
+        _store.load()
+    return _store
@@ -0,0 +1,189 @@
+"""
+CDP network helpers for reader tabs.
+"""
+
+import asyncio
+import base64
+from fnmatch import fnmatchcase
+from typing import Iterable, Optional
+from ..utils.logger import get_logger
+from ..utils.nodriver_compat import load_cdp_module
+
+logger = get_logger(__name__)
+
+
+class NetworkCapture:
+    """
+    Keeps the original bytes of image responses a tab receives.
+
+    Bodies are fetched with Network.getResponseBody as soon as each response
+    finishes loading. They are only used for pages the reader shows as a
+    plain <img>, which then need no second HTTP fetch. Pages are still
+    delivered in reader order once the DOM shows them, and canvas pages are
+    still rendered and encoded in the page.
+    """
+
+    # Smaller images are icons, avatars and placeholders, not chapter pages
+    MIN_SIZE = 15000
+
+    def __init__(self, tab):
+        self.tab = tab
+        self.bodies: dict[str, bytes] = {}
+        self._pending: dict[str, str] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._cdp = load_cdp_module("network")
+
+    async def start(self) -> None:
+        """Enable the Network domain and start collecting image bodies."""
+        await self.tab.send(self._cdp.enable(
+            max_total_buffer_size=256 * 1024 * 1024,
+            max_resource_buffer_size=32 * 1024 * 1024,
+        ))
+        self.tab.add_handler(self._cdp.ResponseReceived, self._on_response)
+        self.tab.add_handler(self._cdp.LoadingFinished, self._on_finished)
+        self.tab.add_handler(self._cdp.LoadingFailed, self._on_failed)
+
+    async def stop(self) -> None:
+        """Stop collecting and drop anything that was not taken."""
+        self.tab.remove_handler(self._cdp.ResponseReceived, self._on_response)
+        self.tab.remove_handler(self._cdp.LoadingFinished, self._on_finished)
+        self.tab.remove_handler(self._cdp.LoadingFailed, self._on_failed)
+        for task in list(self._tasks):
+            task.cancel()
+        self._tasks.clear()
+        self._pending.clear()
+        self.bodies.clear()
+        try:
+            await self.tab.send(self._cdp.disable())
+        except Exception as e:
+            logger.debug(f"Failed to disable network domain: {e}")
+
+    def _on_response(self, event, connection=None) -> None:
+        response = event.response
+        if event.type_ == self._cdp.ResourceType.IMAGE or (response.mime_type or "").startswith("image/"):
+            self._pending[event.request_id] = response.url
+
+    def _on_failed(self, event, connection=None) -> None:
+        self._pending.pop(event.request_id, None)
+
+    def _on_finished(self, event, connection=None) -> None:
+        url = self._pending.pop(event.request_id, None)
+        if url is None:
+            return
+        task = asyncio.ensure_future(self._fetch_body(event.request_id, url))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_body(self, request_id, url: str) -> None:
+        try:
+            body, base64_encoded = await self.tab.send(self._cdp.get_response_body(request_id=request_id))
+        except Exception as e:
+            logger.debug(f"Could not capture response body for {url}: {e}")
+            return
+        data = base64.b64decode(body) if base64_encoded else body.encode("utf-8")
+        if len(data) >= self.MIN_SIZE:
+            self.bodies[url] = data
+
+    async def take(self, url: str, timeout: float = 5.0) -> Optional[bytes]:
+        """Remove and return the captured body for url, waiting briefly for in-flight fetches."""
+        if url not in self.bodies and self._tasks:
+            await asyncio.wait(list(self._tasks), timeout=timeout)
+        return self.bodies.pop(url, None)
+
+
+class ResourceBlocker:
+    """
+    Fails requests the scrapers do not need, using the CDP Fetch domain.
+
+    Only requests matching a blocked resource type or URL pattern are paused;
+    each is then failed unless its URL matches an allow pattern. Cloudflare
+    challenge resources are always allowed.
+    """
+
+    ALWAYS_ALLOWED = ("*://challenges.cloudflare.com/*",)
+
+    def __init__(
+        self,
+        tab,
+        resource_types: Iterable[str] = (),
+        url_patterns: Iterable[str] = (),
+        allowed_patterns: Iterable[str] = (),
+    ):
+        self.tab = tab
+        self.resource_types = list(resource_types)
+        self.url_patterns = list(url_patterns)
+        self.allowed_patterns = list(self.ALWAYS_ALLOWED) + list(allowed_patterns)
+        self.blocked = 0
+        self._tasks: set[asyncio.Task] = set()
+        self._fetch = load_cdp_module("fetch")
+        self._network = load_cdp_module("network")
+
+    @classmethod
+    def from_config(cls, tab, extra_types: Iterable[str] = (), config=None) -> Optional["ResourceBlocker"]:
+        """
+        Build a blocker from the block_* settings, or None when blocking is off.
+
+        Pass the ConfigManager already loaded for the current job to avoid
+        reading config.json again.
+        """
+        if config is None:
+            from ..utils.config import ConfigManager
+            config = ConfigManager()
+        if not config.get("block_resources", True):
+            return None
+        return cls(
+            tab,
+            resource_types=[*config.get("blocked_resource_types", []), *extra_types],
+            url_patterns=config.get("blocked_url_patterns", []),
+            allowed_patterns=config.get("allowed_url_patterns", []),
+        )
+
+    async def start(self) -> None:
+        """Start pausing matching requests."""
+        patterns = []
+        for name in self.resource_types:
+            try:
+                resource_type = self._network.ResourceType(name)
+            except ValueError:
+                logger.warning(f"Unknown resource type in block list: {name}")
+                continue
+            patterns.append(self._fetch.RequestPattern(url_pattern="*", resource_type=resource_type))
+        patterns.extend(self._fetch.RequestPattern(url_pattern=p) for p in self.url_patterns)
+        if not patterns:
+            return
+        self.tab.add_handler(self._fetch.RequestPaused, self._on_paused)
+        await self.tab.send(self._fetch.enable(patterns=patterns))
+
+    async def stop(self) -> None:
+        """Stop blocking; requests still paused are let through."""
+        self.tab.remove_handler(self._fetch.RequestPaused, self._on_paused)
+        try:
+            await self.tab.send(self._fetch.disable())
+        except Exception as e:
+            logger.debug(f"Failed to disable fetch domain: {e}")
+        for task in list(self._tasks):
+            task.cancel()
+        self._tasks.clear()
+        if self.blocked:
+            logger.debug(f"Blocked {self.blocked} non-essential requests")
+
+    def is_allowed(self, url: str) -> bool:
+        """Whether url matches an allow pattern."""
+        return any(fnmatchcase(url, pattern) for pattern in self.allowed_patterns)
+
+    def _on_paused(self, event, connection=None) -> None:
+        task = asyncio.ensure_future(self._resolve(event))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, event) -> None:
+        try:
+            if self.is_allowed(event.request.url):
+                await self.tab.send(self._fetch.continue_request(request_id=event.request_id))
+            else:
+                self.blocked += 1
+                await self.tab.send(self._fetch.fail_request(
+                    request_id=event.request_id, error_reason=self._network.ErrorReason.BLOCKED_BY_CLIENT
+                ))
+        except Exception as e:
+            logger.debug(f"Failed to resolve paused request {event.request.url}: {e}")
@@ -0,0 +1,178 @@
+"""
+Persistent Chrome profile directories for pooled browsers.
+
+A throwaway profile makes every run download comix.to's bundles, fonts and
+reader worker again. Pooled browsers instead run on a slot directory under
+PROFILE_DIR (slot-0, slot-1, ...). Chrome can't share a profile between
+processes, so a running browser holds its slot through an OS file lock. The
+lock is released automatically if the app dies, and it also keeps a CLI and
+a GUI instance running at the same time apart. Each time a slot is handed
+out, its caches are pruned to the size cap, and Chrome's own disk cache is
+kept below the same cap.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_DIR = Path("browser_profile")
+LOCK_FILE = ".comix.lock"
+# Left behind by a Chrome that no longer owns the slot; they would make a new
+# Chrome hand off to the old process
+SINGLETON_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+# Regenerable data, removed oldest file first when a slot is over its cap
+CACHE_DIRS = (
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/GPUCache",
+    "Default/Service Worker/CacheStorage",
+    "Default/Service Worker/ScriptCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "ShaderCache",
+)
+MB = 1024 * 1024
+
+
+def _try_lock(fd: int) -> bool:
+    """Take a non-blocking exclusive lock on an open file."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _files(path: Path) -> list[tuple[float, int, Path]]:
+    """(mtime, size, path) of every file below path."""
+    found = []
+    for root, _, names in os.walk(path):
+        for name in names:
+            file = Path(root) / name
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime, stat.st_size, file))
+    return found
+
+
+class ProfileSlot:
+    """A profile directory held by one running browser."""
+
+    def __init__(self, index: int, path: Path, fd: int):
+        self.index = index
+        self.path = path
+        self._fd: Optional[int] = fd
+
+    def release(self) -> None:
+        """Give the slot back; closing the file drops the lock."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            logger.debug(f"Released browser profile {self.path}")
+
+
+class ProfileStore:
+    """Hands out locked profile slots and keeps each under max_mb."""
+
+    def __init__(self, root: str | Path = PROFILE_DIR, max_mb: int = 500, max_slots: int = 16):
+        self.root = Path(root)
+        self.max_mb = max_mb
+        self.max_slots = max_slots
+        self._lock = threading.Lock()
+
+    @property
+    def disk_cache_bytes(self) -> int:
+        """Value for Chrome's --disk-cache-size, leaving room for the rest of the profile."""
+        return int(self.max_mb * MB * 0.8)
+
+    def acquire(self) -> Optional[ProfileSlot]:
+        """
+        Lock the first free slot and prune it.
+
+        Returns:
+            The slot, or None if all max_slots are in use (the browser then
+            gets a throwaway profile)
+        """
+        with self._lock:
+            for index in range(self.max_slots):
+                path = self.root / f"slot-{index}"
+                try:
+                    path.mkdir(parents=True, exist_ok=True)
+                    fd = os.open(path / LOCK_FILE, os.O_RDWR | os.O_CREAT)
+                except OSError as e:
+                    logger.warning(f"Cannot use browser profile {path}: {e}")
+                    return None
+                if not _try_lock(fd):
+                    os.close(fd)
+                    continue
+
+                for name in SINGLETON_FILES:
+                    try:
+                        (path / name).unlink()
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logger.debug(f"Could not remove {name} from {path}: {e}")
+                self.prune(path)
+                logger.debug(f"Using browser profile {path}")
+                return ProfileSlot(index, path, fd)
+
+        logger.warning(f"All {self.max_slots} browser profiles are in use; using a temporary one")
+        return None
+
+    def prune(self, path: Path) -> int:
+        """
+        Delete cache files, oldest first, until the slot is at 80% of max_mb.
+
+        Only call on a slot that is locked and has no browser running.
+
+        Returns:
+            Bytes freed
+        """
+        cap = self.max_mb * MB
+        total = sum(size for _, size, _ in _files(path))
+        if total <= cap:
+            return 0
+
+        target = int(cap * 0.8)
+        freed = 0
+        caches = sorted(f for cache in CACHE_DIRS for f in _files(path / cache))
+        for _, size, file in caches:
+            if total - freed <= target:
+                break
+            try:
+                file.unlink()
+                freed += size
+            except OSError:
+                pass
+        logger.info(f"Pruned {freed // MB} MB of cache from browser profile {path}")
+        return freed
+
+
+_store: Optional[ProfileStore] = None
+_store_lock = threading.Lock()
+
+
+def get_profile_store() -> Optional[ProfileStore]:
+    """Get the shared profile store, or None when browser_profile_dir is empty (throwaway profiles)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            from ..utils.config import ConfigManager
+            config = ConfigManager()
+            root = config.get("browser_profile_dir", str(PROFILE_DIR))
+            if not root:
+                return None
+            _store = ProfileStore(root, max_mb=config.get("browser_profile_max_mb", 500))
+        return _store
@@ -29,6 +29,8 @@ class ComixDownloaderApp:
     def __init__(self):
         self.config_manager = ConfigManager()
         self._setup_logging()
+        # Launch the browser while the user is still in the menus
+        ComixAPI.warm_up(self.config_manager.get("headless", True))
     
     def _setup_logging(self):
         """Setup logging based on config."""
@@ -72,10 +74,10 @@ class ComixDownloaderApp:
             return
         
         try:
-            # Extract manga code and fetch info
-            with console.status("[bold cyan]Fetching manga information..."):
+            # Extract manga code and fetch info and chapters from one page load
+            with console.status("[bold cyan]Fetching manga information and chapters..."):
                 manga_code = ComixAPI.extract_manga_code(url)
-                manga = ComixAPI.get_manga_info(manga_code)
+                manga, chapters = ComixAPI.fetch_title(manga_code)
             
             if not manga:
                 Display.error("Could not fetch manga information")
@@ -83,10 +85,6 @@ class ComixDownloaderApp:
             
             Display.show_manga_info(manga)
             
-            # Fetch chapters
-            with console.status("[bold cyan]Fetching chapters..."):
-                chapters = ComixAPI.get_all_chapters(manga_code)
-            
             if not chapters:
                 Display.error("No chapters found")
                 return
@@ -183,8 +181,7 @@ def download(
         
         try:
             manga_code = ComixAPI.extract_manga_code(url)
-            manga = ComixAPI.get_manga_info(manga_code, headless=config.headless)
-            all_chapters = ComixAPI.get_all_chapters(manga_code, headless=config.headless)
+            manga, all_chapters = ComixAPI.fetch_title(manga_code, headless=config.headless)
             
             if chapters and chapters.lower() != "all":
                 from .menus import ChapterSelector
@@ -3,9 +3,9 @@ Main downloader with threading support for concurrent downloads.
 """
 
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import threading
-from typing import Optional, Callable
+from typing import Optional, Callable, Hashable, Iterable, TypeVar
 from rich.progress import Progress, TaskID, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
 
 from .models import MangaInfo, Chapter, DownloadConfig, OutputFormat
@@ -31,6 +31,46 @@ def is_cancelled():
     return _cancel_event.is_set()
 
 
+T = TypeVar("T")
+
+
+def _reading_order(number) -> tuple:
+    try:
+        return 0, float(number)
+    except (TypeError, ValueError):
+        return 1, 0.0
+
+
+def plan_chapter_lanes(
+    chapters: list[T], lanes: int, number: Callable[[T], str] = lambda c: c.number
+) -> list[list[T]]:
+    """
+    Split chapters into contiguous runs in reading order, one per worker.
+    
+    A worker downloads its run in order on one browser tab, so each chapter
+    is the next one of the reader already open there and can be reached
+    in-app instead of with a cold page load.
+    
+    Args:
+        chapters: Chapters in any order
+        lanes: Number of workers
+        number: Gets a chapter's number
+    
+    Returns:
+        Non-empty runs of adjacent chapters
+    """
+    ordered = sorted(chapters, key=lambda c: _reading_order(number(c)))
+    lanes = max(1, min(lanes, len(ordered)))
+    size, extra = divmod(len(ordered), lanes)
+    runs = []
+    start = 0
+    for i in range(lanes):
+        end = start + size + (1 if i < extra else 0)
+        runs.append(ordered[start:end])
+        start = end
+    return [run for run in runs if run]
+
+
 class ImageDownloader:
     """Downloads images with threading and retry logic."""
     
@@ -41,13 +81,20 @@ class ImageDownloader:
             base_delay=config.retry_delay
         )
     
-    def download_image(self, url: str, index: int) -> tuple[int, bytes | None, str | None]:
+    def download_image(self, url: str | bytes, index: int) -> tuple[int, bytes | None, str | None]:
         """
         Download a single image with retry logic.
         
+        Args:
+            url: Image URL, data URL, or image bytes already extracted from the browser
+            index: Page index
+        
         Returns:
             Tuple of (index, image_bytes, error_message)
         """
+        if isinstance(url, bytes):
+            return index, url, None
+            
         if url.startswith("data:image/"):
             try:
                 import base64
@@ -83,7 +130,7 @@ class ImageDownloader:
     
     def download_all_images(
         self,
-        image_urls: list[str],
+        image_urls: list[str | bytes],
         progress: Optional[Progress] = None,
         task_id: Optional[TaskID] = None,
         on_progress: Optional[Callable[[int, int], None]] = None
@@ -91,40 +138,76 @@ class ImageDownloader:
         """
         Download all images concurrently.
         
+        Returns:
+            List of (index, image_bytes) tuples for successful downloads
+        """
+        logger.info(f"Downloading {len(image_urls)} images concurrently...")
+        return self.download_stream(
+            enumerate(image_urls, 1), progress, task_id, on_progress, expected=lambda: len(image_urls)
+        )
+    
+    def download_stream(
+        self,
+        pages: Iterable[tuple[int, str | bytes]],
+        progress: Optional[Progress] = None,
+        task_id: Optional[TaskID] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        expected: Optional[Callable[[], int]] = None
+    ) -> list[tuple[int, bytes]]:
+        """
+        Download images as (index, url_or_bytes) pairs arrive from an iterator.
+        
+        Each page is queued on the worker pool as soon as the iterator yields
+        it, so downloads overlap with whatever produces the pages.
+        
+        Args:
+            pages: Iterator of (index, url_or_bytes)
+            expected: Returns the number of pages expected so far, for progress
+        
         Returns:
             List of (index, image_bytes) tuples for successful downloads
         """
         results = []
         failed = []
+        futures = {}
         
-        logger.info(f"Downloading {len(image_urls)} images concurrently...")
+        def collect(future):
+            idx = futures[future]
+            try:
+                index, data, error = future.result()
+                if data:
+                    results.append((index, data))
+                else:
+                    failed.append((index, error))
+                    logger.error(f"Failed to download image {index}: {error}")
+            except Exception as e:
+                failed.append((idx, str(e)))
+                logger.error(f"Exception downloading image {idx}: {e}")
+            
+            if progress and task_id is not None:
+                progress.advance(task_id)
+            
+            if on_progress:
+                total = max(expected() if expected else 0, len(futures))
+                on_progress(len(results) + len(failed), total)
         
         with ThreadPoolExecutor(max_workers=self.config.max_image_workers) as executor:
-            futures = {
-                executor.submit(self.download_image, url, idx): idx
-                for idx, url in enumerate(image_urls, 1)
-            }
+            pending = set()
+            for idx, url in pages:
+                if is_cancelled():
+                    break
+                future = executor.submit(self.download_image, url, idx)
+                futures[future] = idx
+                pending.add(future)
+                # Report pages that finished while waiting for the next one
+                for finished in [f for f in pending if f.done()]:
+                    pending.discard(finished)
+                    collect(finished)
             
-            for future in as_completed(futures):
+            for future in as_completed(pending):
                 if is_cancelled():
                     break
-                idx = futures[future]
-                try:
-                    index, data, error = future.result()
-                    if data:
-                        results.append((index, data))
-                    else:
-                        failed.append((index, error))
-                        logger.error(f"Failed to download image {index}: {error}")
-                except Exception as e:
-                    failed.append((idx, str(e)))
-                    logger.error(f"Exception downloading image {idx}: {e}")
-                
-                if progress and task_id:
-                    progress.advance(task_id)
-                
-                if on_progress:
-                    on_progress(len(results) + len(failed), len(image_urls))
+                collect(future)
         
         if failed:
             logger.warning(f"{len(failed)} images failed to download")
@@ -145,11 +228,14 @@ class ChapterDownloader:
         chapter: Chapter,
         progress: Optional[Progress] = None,
         parent_task: Optional[TaskID] = None,
-        on_image_progress: Optional[Callable[[int, int], None]] = None
+        on_image_progress: Optional[Callable[[int, int], None]] = None,
+        lane: Optional[Hashable] = None
     ) -> tuple[bool, str]:
         """
         Download a chapter and save in configured format.
         
+        Chapters downloaded in order with the same lane key share a browser tab.
+        
         Returns:
             Tuple of (success, message)
         """
@@ -157,34 +243,45 @@ class ChapterDownloader:
         chapter_folder = chapter.get_safe_folder_name()
         base_path = Path(self.config.download_path) / manga_folder
         
+        task_id = None
         try:
-            # Fetch image URLs
-            from ..api.comix import ComixAPI
-            image_urls = ComixAPI.get_chapter_images(
-                chapter.chapter_id,
-                manga_slug=self.manga.slug or self.manga.hash_id,
-                chapter_number=chapter.number,
-                headless=self.config.headless
-            )
-            
-            if not image_urls:
-                return False, f"No images found for {chapter.get_display_name()}"
-            
-            # Create task for image downloads
-            task_id = None
+            # Create task for image downloads; its total is set once the reader reports it
             if progress:
                 task_id = progress.add_task(
                     f"[cyan]  └─ {chapter.get_display_name()}",
-                    total=len(image_urls)
+                    total=None
                 )
+            page_count = 0
+            
+            def set_page_count(count: int) -> None:
+                nonlocal page_count
+                page_count = count
+                if progress and task_id is not None:
+                    progress.update(task_id, total=count)
             
-            # Download all images
-            image_data = self.image_downloader.download_all_images(
-                image_urls, progress, task_id, on_progress=on_image_progress
+            # Download pages while the browser is still extracting the rest
+            from ..api.comix import ComixAPI
+            pages = ComixAPI.stream_chapter_images(
+                chapter.chapter_id,
+                manga_slug=self.manga.slug or self.manga.hash_id,
+                chapter_number=chapter.number,
+                headless=self.config.headless,
+                image_encoding=self.config.get_image_encoding().value,
+                image_quality=self.config.image_quality,
+                on_page_count=set_page_count,
+                affinity=lane
+            )
+            image_data = self.image_downloader.download_stream(
+                pages, progress, task_id, on_progress=on_image_progress, expected=lambda: page_count
             )
             
             if not image_data:
-                return False, f"Failed to download any images for {chapter.get_display_name()}"
+                if progress and task_id is not None:
+                    progress.remove_task(task_id)
+                return False, f"No images found for {chapter.get_display_name()}"
+            
+            # Reader page numbers skip ad pages; number the saved pages 1..n
+            image_data = [(i, data) for i, (_, data) in enumerate(image_data, 1)]
             
             # Save in configured format
             if self.config.output_format == OutputFormat.IMAGES:
@@ -210,8 +307,8 @@ class ChapterDownloader:
                     cbz_path = base_path / f"{chapter_folder}.cbz"
                     create_cbz_from_bytes(image_data, cbz_path, self.manga, chapter)
             
-            if progress and task_id:
-                progress.update(task_id, completed=len(image_urls))
+            if progress and task_id is not None:
+                progress.update(task_id, total=len(image_data), completed=len(image_data))
             
             return True, f"Downloaded {chapter.get_display_name()} ({len(image_data)} pages)"
             
@@ -250,16 +347,27 @@ class MangaDownloader:
             total=len(chapters)
         )
         
-        with ThreadPoolExecutor(max_workers=self.config.max_chapter_workers) as executor:
-            futures = {
-                executor.submit(
-                    chapter_downloader.download_chapter,
-                    chapter,
-                    progress,
-                    main_task
-                ): chapter
-                for chapter in chapters
-            }
+        # One lane of consecutive chapters per worker, each lane on its own tab
+        lanes = plan_chapter_lanes(chapters, self.config.max_chapter_workers)
+        futures: dict[Future, Chapter] = {}
+        
+        def run_lane(lane_key: Hashable, lane: list[tuple[Chapter, Future]]) -> None:
+            for chapter, future in lane:
+                if is_cancelled() or not future.set_running_or_notify_cancel():
+                    future.cancel()
+                    continue
+                try:
+                    future.set_result(chapter_downloader.download_chapter(
+                        chapter, progress, main_task, lane=lane_key
+                    ))
+                except Exception as e:
+                    future.set_exception(e)
+        
+        with ThreadPoolExecutor(max_workers=max(1, len(lanes))) as executor:
+            for i, lane in enumerate(lanes):
+                lane_futures = [(chapter, Future()) for chapter in lane]
+                futures.update((future, chapter) for chapter, future in lane_futures)
+                executor.submit(run_lane, (manga.hash_id, i), lane_futures)
             
             for future in as_completed(futures):
                 if is_cancelled():
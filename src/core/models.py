@@ -14,6 +14,14 @@ class OutputFormat(str, Enum):
     CBZ = "cbz"
 
 
+class ImageEncoding(str, Enum):
+    """Encodings the browser can produce for canvas pages."""
+    AUTO = "auto"
+    JPEG = "jpeg"
+    WEBP = "webp"
+    PNG = "png"
+
+
 @dataclass
 class MangaInfo:
     """Manga information from API."""
@@ -84,3 +92,14 @@ class DownloadConfig:
     retry_count: int = 3
     retry_delay: float = 2.0
     headless: bool = True
+    image_encoding: ImageEncoding = ImageEncoding.AUTO
+    image_quality: float = 0.95
+    
+    def get_image_encoding(self) -> ImageEncoding:
+        """Get the canvas encoding to request, resolving AUTO for the output format."""
+        if self.image_encoding != ImageEncoding.AUTO:
+            return self.image_encoding
+        # PDF embeds JPEG as-is; other outputs keep the smaller WebP
+        if self.output_format == OutputFormat.PDF:
+            return ImageEncoding.JPEG
+        return ImageEncoding.WEBP
@@ -14,6 +14,40 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _jpeg_reader(img: Image.Image, source) -> ImageReader:
+    """
+    Get an ImageReader that embeds the page as JPEG.
+    
+    JPEG sources in RGB or grayscale are handed to reportlab untouched, which
+    copies them into the PDF as-is. Anything else is flattened onto white and
+    encoded as JPEG once.
+    
+    Args:
+        img: Opened PIL image
+        source: Path or file-like object holding the original image bytes
+    
+    Returns:
+        ImageReader for drawImage
+    """
+    if img.format == 'JPEG' and img.mode in ('RGB', 'L'):
+        return ImageReader(source)
+    
+    # Convert to RGB if necessary (for PNG with transparency)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+        img = background
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+    
+    img_buffer = BytesIO()
+    img.save(img_buffer, format='JPEG', quality=95)
+    img_buffer.seek(0)
+    return ImageReader(img_buffer)
+
+
 def create_pdf(
     image_paths: list[Path],
     output_path: str | Path,
@@ -47,16 +81,6 @@ def create_pdf(
         try:
             img = Image.open(img_path)
             
-            # Convert to RGB if necessary (for PNG with transparency)
-            if img.mode in ('RGBA', 'LA', 'P'):
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = background
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
-            
             # Get image dimensions
             img_width, img_height = img.size
             
@@ -64,11 +88,7 @@ def create_pdf(
             c.setPageSize((img_width, img_height))
             
             # Draw image on page
-            img_buffer = BytesIO()
-            img.save(img_buffer, format='JPEG', quality=95)
-            img_buffer.seek(0)
-            
-            c.drawImage(ImageReader(img_buffer), 0, 0, img_width, img_height)
+            c.drawImage(_jpeg_reader(img, img_path), 0, 0, img_width, img_height)
             c.showPage()
             
             logger.debug(f"Added to PDF: {img_path.name}")
@@ -112,24 +132,10 @@ def create_pdf_from_bytes(
         try:
             img = Image.open(BytesIO(data))
             
-            # Convert to RGB if necessary
-            if img.mode in ('RGBA', 'LA', 'P'):
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = background
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
-            
             img_width, img_height = img.size
             c.setPageSize((img_width, img_height))
             
-            img_buffer = BytesIO()
-            img.save(img_buffer, format='JPEG', quality=95)
-            img_buffer.seek(0)
-            
-            c.drawImage(ImageReader(img_buffer), 0, 0, img_width, img_height)
+            c.drawImage(_jpeg_reader(img, BytesIO(data)), 0, 0, img_width, img_height)
             c.showPage()
             
         except Exception as e:
@@ -0,0 +1,126 @@
+"""
+Long-lived asyncio event loop running on a background thread.
+
+Browser connections are bound to the loop that created them, so every
+nodriver call runs on this one loop. Sync code submits coroutines and
+blocks on the result; async code on another loop awaits them without
+tying up a thread.
+"""
+
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EventLoopThread:
+    """Owns an event loop and the daemon thread that runs it."""
+
+    def __init__(self, name: str = "comix-event-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first access."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+                logger.debug(f"Started event loop thread {self.name}")
+            return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on this loop's thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable) -> "asyncio.Future":
+        """Schedule a coroutine on the loop and return a concurrent future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and block until it finishes."""
+        if self.in_loop_thread():
+            raise RuntimeError("run() would deadlock when called from the loop thread; await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    async def run_coroutine(self, coro: Awaitable) -> Any:
+        """Await a coroutine on this loop from any loop."""
+        if self.in_loop_thread():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def iterate(self, agen: AsyncIterator) -> Iterator:
+        """
+        Drive an async generator on the loop and yield its items to sync code.
+        
+        Items are handed over as soon as they are produced; leaving the loop
+        early cancels the generator.
+        """
+        if self.in_loop_thread():
+            raise RuntimeError("iterate() would deadlock when called from the loop thread; use async for instead")
+        items: queue.Queue = queue.Queue()
+        done = object()
+        
+        async def pump():
+            try:
+                async for item in agen:
+                    items.put((True, item))
+            except Exception as e:
+                items.put((False, e))
+            finally:
+                items.put((True, done))
+        
+        future = self.submit(pump())
+        try:
+            while True:
+                ok, item = items.get()
+                if not ok:
+                    raise item
+                if item is done:
+                    return
+                yield item
+        finally:
+            future.cancel()
+
+    def stop(self) -> None:
+        """Stop the loop; pending work is abandoned."""
+        with self._lock:
+            if self._loop is not None and self._loop.is_running():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=5)
+            self._loop = None
+            self._thread = None
+
+
+_loop_thread: Optional[EventLoopThread] = None
+_loop_thread_lock = threading.Lock()
+
+
+def get_event_loop_thread() -> EventLoopThread:
+    """Get the singleton event loop thread."""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = EventLoopThread()
+        return _loop_thread
+
+
+def run_async(coro: Awaitable) -> Any:
+    """Run an async coroutine synchronously on the shared event loop."""
+    return get_event_loop_thread().run(coro)
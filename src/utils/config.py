@@ -5,7 +5,7 @@ Configuration management - load/save settings from config.json.
 import json
 from pathlib import Path
 from typing import Any
-from ..core.models import DownloadConfig, OutputFormat
+from ..core.models import DownloadConfig, OutputFormat, ImageEncoding
 from .logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,7 +24,37 @@ class ConfigManager:
         "retry_count": 3,
         "retry_delay": 2.0,
         "chapters_display_limit": 20,  # 0 = show all
-        "headless": True
+        "headless": True,
+        "warm_up_browser": True,  # start the browser in the background at launch
+        "image_encoding": "auto",  # auto | jpeg | webp | png
+        "image_quality": 0.95,
+        "browser_pool_size": 1,
+        "max_tabs_per_browser": 4,
+        "browser_profile_dir": "browser_profile",  # persistent per-browser profiles, "" = temporary
+        "browser_profile_max_mb": 500,  # cap per profile; caches are pruned at each launch
+        "browser_max_uses": 200,  # tab leases before a browser is recycled, 0 = never
+        "browser_max_rss_mb": 2048,  # browser process tree RSS limit, 0 = no limit
+        "tab_heartbeat_interval": 5.0,
+        "tab_heartbeat_timeout": 20.0,  # hung tabs are closed and their chapter re-queued
+        "in_reader_navigation": True,  # move between consecutive chapters without reloading
+        "extraction_mode": "batched",  # batched | sequential | viewport
+        # network: reuse the reader's bytes for plain <img> pages instead of fetching
+        # them again; canvas pages are still rendered and encoded either way
+        "capture_mode": "canvas",  # canvas | network
+        "block_resources": True,
+        "blocked_resource_types": ["Font", "Media"],  # CDP Network.ResourceType names
+        "blocked_url_patterns": [
+            "*google-analytics.com*",
+            "*googletagmanager.com*",
+            "*googlesyndication.com*",
+            "*doubleclick.net*",
+            "*cloudflareinsights.com*",
+            "*disqus.com*",
+            "*disquscdn.com*",
+        ],
+        "allowed_url_patterns": [],  # always wins over the block lists
+        "use_api": True,  # try the JSON API before the browser
+        "api_chapter_images": False
     }
     
     def __init__(self, config_path: str | Path = "config.json"):
@@ -75,7 +105,9 @@ class ConfigManager:
             download_path=self.get("download_path", "downloads"),
             retry_count=self.get("retry_count", 3),
             retry_delay=self.get("retry_delay", 2.0),
-            headless=self.get("headless", True)
+            headless=self.get("headless", True),
+            image_encoding=ImageEncoding(self.get("image_encoding", "auto")),
+            image_quality=self.get("image_quality", 0.95)
         )
     
     def update_from_download_config(self, config: DownloadConfig) -> None:
@@ -89,7 +121,9 @@ class ConfigManager:
             "download_path": config.download_path,
             "retry_count": config.retry_count,
             "retry_delay": config.retry_delay,
-            "headless": config.headless
+            "headless": config.headless,
+            "image_encoding": config.image_encoding.value,
+            "image_quality": config.image_quality
         })
         self.save()
     
@@ -1,11 +1,64 @@
 """
 Utility to generate Comix.to API hashes.
 Ported from TypeScript implementation.
+
+Each round is RC4, an XOR with a repeating mutation key and a byte mutation
+chosen by position % 10. The RC4 keystream does not depend on the data, so
+it is generated once per round and pre-XORed with the mutation key; the ten
+mutations become bytes.translate tables.
 """
 
 import base64
+import functools
 import urllib.parse
-from typing import List
+from typing import Callable, List, Optional
+
+
+class _Round:
+    """Precomputed keystream, translation tables and prefix for one round."""
+
+    def __init__(self, rc4_key: bytes, mut_key: bytes, pref_key: bytes, prefix_len: int, mutations: List[Callable[[int], int]]):
+        self.rc4_key = rc4_key
+        self.mut_key = mut_key
+        self.prefix = pref_key[:prefix_len]
+        self.tables = [bytes(mutate(v) for v in range(256)) for mutate in mutations]
+        self.pad = b""
+
+    def _grow_pad(self, size: int) -> bytes:
+        """
+        Build the RC4 keystream XOR mutation key for at least size bytes.
+
+        Requests are signed from several threads, so the pad is built locally
+        and only published if it is longer than the one installed meanwhile.
+        """
+        size = max(size, 2 * len(self.pad), 256)
+        stream = ComixHash.rc4(self.rc4_key, bytes(size))
+        mask = bytes(ComixHash.get_mut_key(self.mut_key, i) for i in range(32)) * (size // 32 + 1)
+        pad = (int.from_bytes(stream, "little") ^ int.from_bytes(mask[:size], "little")).to_bytes(size, "little")
+        if len(pad) > len(self.pad):
+            self.pad = pad
+        return pad
+
+    def apply(self, data: bytes) -> bytearray:
+        n = len(data)
+        # One read of self.pad; another thread may replace it while this one works
+        pad = self.pad
+        if n > len(pad):
+            pad = self._grow_pad(n)
+        mixed = (int.from_bytes(data, "little") ^ int.from_bytes(pad[:n], "little")).to_bytes(n, "little")
+
+        out = bytearray(mixed)
+        for m, table in enumerate(self.tables):
+            out[m::10] = mixed[m::10].translate(table)
+
+        # The prefix key bytes go in front of the first output bytes, one each
+        k = min(len(self.prefix), n)
+        if k:
+            head = bytearray(2 * k)
+            head[0::2] = self.prefix[:k]
+            head[1::2] = out[:k]
+            out[:k] = head
+        return out
 
 
 class ComixHash:
@@ -19,10 +72,15 @@ class ComixHash:
         "U9LRYFL2zXU4TtALIYDj+lCATRk/EJtH7/y7qYYNlh8=", "e/GtffFDTvnw7LBRixAD+iGixjqTq9kIZ1m0Hj+s6fY=", "xb2XwHNB"
     ]
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _decoded_keys() -> tuple:
+        return tuple(base64.b64decode(k) for k in ComixHash.KEYS)
+
     @staticmethod
     def encoded_keys() -> List[bytes]:
         """Decode all keys from Base64."""
-        return [base64.b64decode(k) for k in ComixHash.KEYS]
+        return list(ComixHash._decoded_keys())
 
     @staticmethod
     def rc4(key: bytes, data: bytes) -> bytearray:
@@ -74,142 +132,74 @@ class ComixHash:
     def get_mut_key(mk: bytes, idx: int) -> int:
         return mk[idx % 32] if (len(mk) > 0 and idx % 32 < len(mk)) else 0
 
-    @classmethod
-    def round1(cls, data: bytes, keys: List[bytes]) -> bytearray:
-        enc = cls.rc4(keys[0], data)
-        mut_key = keys[1]
-        pref_key = keys[2]
-        out = bytearray()
-
-        for i in range(len(enc)):
-            if i < 7 and i < len(pref_key):
-                out.append(pref_key[i])
-            v = enc[i] ^ cls.get_mut_key(mut_key, i)
-            
-            m = i % 10
-            if m == 0 or m == 9: v = cls.mut_c(v)
-            elif m == 1: v = cls.mut_b(v)
-            elif m == 2: v = cls.mut_y(v)
-            elif m == 3: v = cls.mut_dollar(v)
-            elif m == 4 or m == 6: v = cls.mut_h(v)
-            elif m == 5: v = cls.mut_s(v)
-            elif m == 7: v = cls.mut_k(v)
-            elif m == 8: v = cls.mut_l(v)
-            out.append(v & 0xff)
-        return out
+    # Per round: RC4 key index (mutation and prefix keys follow it), prefix
+    # length, and the mutation for each position % 10
+    ROUNDS = [
+        (0, 7, ("c", "b", "y", "dollar", "h", "s", "h", "k", "l", "c")),
+        (3, 6, ("c", "b", "dollar", "h", "s", "k", "dollar", "underscore", "c", "s")),
+        (6, 7, ("c", "f", "s", "g", "y", "m", "dollar", "k", "s", "b")),
+        (9, 8, ("b", "m", "l", "s", "underscore", "s", "underscore", "l", "y", "m")),
+        (12, 6, ("underscore", "s", "c", "m", "b", "m", "f", "s", "dollar", "g")),
+    ]
 
     @classmethod
-    def round2(cls, data: bytes, keys: List[bytes]) -> bytearray:
-        enc = cls.rc4(keys[3], data)
-        mut_key = keys[4]
-        pref_key = keys[5]
-        out = bytearray()
-
-        for i in range(len(enc)):
-            if i < 6 and i < len(pref_key):
-                out.append(pref_key[i])
-            v = enc[i] ^ cls.get_mut_key(mut_key, i)
-            
-            m = i % 10
-            if m == 0 or m == 8: v = cls.mut_c(v)
-            elif m == 1: v = cls.mut_b(v)
-            elif m == 2 or m == 6: v = cls.mut_dollar(v)
-            elif m == 3: v = cls.mut_h(v)
-            elif m == 4 or m == 9: v = cls.mut_s(v)
-            elif m == 5: v = cls.mut_k(v)
-            elif m == 7: v = cls.mut_underscore(v)
-            out.append(v & 0xff)
-        return out
+    def _build_rounds(cls, keys) -> List[_Round]:
+        return [
+            _Round(keys[k], keys[k + 1], keys[k + 2], prefix_len, [getattr(cls, f"mut_{name}") for name in mutations])
+            for k, prefix_len, mutations in cls.ROUNDS
+        ]
 
     @classmethod
-    def round3(cls, data: bytes, keys: List[bytes]) -> bytearray:
-        enc = cls.rc4(keys[6], data)
-        mut_key = keys[7]
-        pref_key = keys[8]
-        out = bytearray()
+    def _rounds(cls, keys: Optional[List[bytes]] = None) -> List[_Round]:
+        """Rounds for the given keys; the default keys' rounds are built once."""
+        if keys is not None and tuple(keys) != cls._decoded_keys():
+            return cls._build_rounds(keys)
+        if "_default_rounds" not in cls.__dict__:
+            cls._default_rounds = cls._build_rounds(cls._decoded_keys())
+        return cls._default_rounds
 
-        for i in range(len(enc)):
-            if i < 7 and i < len(pref_key):
-                out.append(pref_key[i])
-            v = enc[i] ^ cls.get_mut_key(mut_key, i)
-            
-            m = i % 10
-            if m == 0: v = cls.mut_c(v)
-            elif m == 1: v = cls.mut_f(v)
-            elif m == 2 or m == 8: v = cls.mut_s(v)
-            elif m == 3: v = cls.mut_g(v)
-            elif m == 4: v = cls.mut_y(v)
-            elif m == 5: v = cls.mut_m(v)
-            elif m == 6: v = cls.mut_dollar(v)
-            elif m == 7: v = cls.mut_k(v)
-            elif m == 9: v = cls.mut_b(v)
-            out.append(v & 0xff)
-        return out
+    @classmethod
+    def round1(cls, data: bytes, keys: Optional[List[bytes]] = None) -> bytearray:
+        return cls._rounds(keys)[0].apply(data)
 
     @classmethod
-    def round4(cls, data: bytes, keys: List[bytes]) -> bytearray:
-        enc = cls.rc4(keys[9], data)
-        mut_key = keys[10]
-        pref_key = keys[11]
-        out = bytearray()
+    def round2(cls, data: bytes, keys: Optional[List[bytes]] = None) -> bytearray:
+        return cls._rounds(keys)[1].apply(data)
 
-        for i in range(len(enc)):
-            if i < 8 and i < len(pref_key):
-                out.append(pref_key[i])
-            v = enc[i] ^ cls.get_mut_key(mut_key, i)
-            
-            m = i % 10
-            if m == 0: v = cls.mut_b(v)
-            elif m == 1 or m == 9: v = cls.mut_m(v)
-            elif m == 2 or m == 7: v = cls.mut_l(v)
-            elif m == 3 or m == 5: v = cls.mut_s(v)
-            elif m == 4 or m == 6: v = cls.mut_underscore(v)
-            elif m == 8: v = cls.mut_y(v)
-            out.append(v & 0xff)
-        return out
+    @classmethod
+    def round3(cls, data: bytes, keys: Optional[List[bytes]] = None) -> bytearray:
+        return cls._rounds(keys)[2].apply(data)
 
     @classmethod
-    def round5(cls, data: bytes, keys: List[bytes]) -> bytearray:
-        enc = cls.rc4(keys[12], data)
-        mut_key = keys[13]
-        pref_key = keys[14]
-        out = bytearray()
+    def round4(cls, data: bytes, keys: Optional[List[bytes]] = None) -> bytearray:
+        return cls._rounds(keys)[3].apply(data)
 
-        for i in range(len(enc)):
-            if i < 6 and i < len(pref_key):
-                out.append(pref_key[i])
-            v = enc[i] ^ cls.get_mut_key(mut_key, i)
-            
-            m = i % 10
-            if m == 0: v = cls.mut_underscore(v)
-            elif m == 1 or m == 7: v = cls.mut_s(v)
-            elif m == 2: v = cls.mut_c(v)
-            elif m == 3 or m == 5: v = cls.mut_m(v)
-            elif m == 4: v = cls.mut_b(v)
-            elif m == 6: v = cls.mut_f(v)
-            elif m == 8: v = cls.mut_dollar(v)
-            elif m == 9: v = cls.mut_g(v)
-            out.append(v & 0xff)
-        return out
+    @classmethod
+    def round5(cls, data: bytes, keys: Optional[List[bytes]] = None) -> bytearray:
+        return cls._rounds(keys)[4].apply(data)
 
     @classmethod
     def generate_hash(cls, path: str, body_size: int = 0, time: int = 1) -> str:
         """Generate the Comix hash for a given request path and time."""
+        return _cached_hash(path, body_size, time)
+
+    @classmethod
+    def _compute_hash(cls, path: str, body_size: int, time: int) -> str:
         base_string = f"{path}:{body_size}:{time}"
         # JS encodeURIComponent equivalent in Python
         encoded = urllib.parse.quote(base_string, safe="-_.!~*'()")
-        initial_bytes = encoded.encode('utf-8')
+        data = encoded.encode('utf-8')
         
-        keys = cls.encoded_keys()
-        
-        res1 = cls.round1(initial_bytes, keys)
-        res2 = cls.round2(res1, keys)
-        res3 = cls.round3(res2, keys)
-        res4 = cls.round4(res3, keys)
-        res5 = cls.round5(res4, keys)
+        for round_ in cls._rounds():
+            data = round_.apply(data)
         
         # JS GetURLBase64FromBytes equivalent
-        return base64.urlsafe_b64encode(res5).decode('ascii').rstrip('=')
+        return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_hash(path: str, body_size: int, time: int) -> str:
+    return ComixHash._compute_hash(path, body_size, time)
 
 
 def generate_comix_hash(path: str, body_size: int = 0, time: int = 1) -> str:
@@ -0,0 +1,186 @@
+"""
+Rolling latency statistics for browser waits.
+
+Each wait type (title page, page render, ...) keeps an EWMA and a window of
+recent samples. Deadlines are derived from the p95 of that window, so a
+condition that is never going to come true is given up on sooner, while a
+run of timeouts falls back to the full default budget. Stats are kept in
+latency_stats.json between runs.
+"""
+
+import atexit
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Optional
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+LATENCY_FILE = Path("latency_stats.json")
+
+
+class WaitStats:
+    """Latency samples of one wait type, in seconds."""
+
+    def __init__(self, window: int = 200):
+        self.ewma: Optional[float] = None
+        self.samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.timeouts = 0
+        self.consecutive_timeouts = 0
+
+    def add(self, seconds: float, alpha: float) -> None:
+        self.ewma = seconds if self.ewma is None else alpha * seconds + (1 - alpha) * self.ewma
+        self.samples.append(seconds)
+        self.count += 1
+        self.consecutive_timeouts = 0
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def to_dict(self) -> dict:
+        return {"ewma": self.ewma, "samples": list(self.samples), "count": self.count, "timeouts": self.timeouts}
+
+    @classmethod
+    def from_dict(cls, data: dict, window: int) -> "WaitStats":
+        stats = cls(window)
+        stats.ewma = data.get("ewma")
+        stats.samples.extend(float(s) for s in data.get("samples", []))
+        stats.count = int(data.get("count", len(stats.samples)))
+        stats.timeouts = int(data.get("timeouts", 0))
+        return stats
+
+
+class LatencyTracker:
+    """Learns per-wait-type deadlines and poll intervals from observed latencies."""
+
+    def __init__(
+        self,
+        path: str | Path = LATENCY_FILE,
+        alpha: float = 0.2,
+        window: int = 200,
+        headroom: float = 3.0,
+        min_samples: int = 5,
+        save_interval: float = 30.0,
+    ):
+        self.path = Path(path)
+        self.alpha = alpha
+        self.window = window
+        self.headroom = headroom
+        self.min_samples = min_samples
+        self.save_interval = save_interval
+        self._stats: dict[str, WaitStats] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    def load(self) -> None:
+        """Load stats saved by a previous run."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            with self._lock:
+                self._stats = {kind: WaitStats.from_dict(d, self.window) for kind, d in data.items()}
+            logger.debug(f"Loaded latency stats from {self.path}")
+        except (json.JSONDecodeError, IOError, TypeError, ValueError, AttributeError) as e:
+            logger.warning(f"Failed to load latency stats: {e}")
+
+    def save(self) -> None:
+        """Write the stats to disk if they changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {kind: stats.to_dict() for kind, stats in self._stats.items()}
+            self._dirty = False
+            self._last_save = time.monotonic()
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except IOError as e:
+            logger.error(f"Failed to save latency stats: {e}")
+
+    def _get(self, kind: str) -> WaitStats:
+        stats = self._stats.get(kind)
+        if stats is None:
+            stats = self._stats[kind] = WaitStats(self.window)
+        return stats
+
+    def record(self, kind: str, seconds: float) -> None:
+        """Record how long a successful wait took."""
+        with self._lock:
+            self._get(kind).add(seconds, self.alpha)
+            self._dirty = True
+            due = time.monotonic() - self._last_save >= self.save_interval
+        if due:
+            self.save()
+
+    def record_timeout(self, kind: str) -> None:
+        """Record a wait that ran out of time."""
+        with self._lock:
+            stats = self._get(kind)
+            stats.timeouts += 1
+            stats.consecutive_timeouts += 1
+            self._dirty = True
+
+    def deadline(self, kind: str, default: float, floor: float) -> float:
+        """
+        Timeout for the next wait of this kind.
+
+        Args:
+            kind: Wait type
+            default: Budget used until enough samples exist, and after a timeout
+            floor: Lowest deadline ever handed out
+
+        Returns:
+            Seconds, between floor and default
+        """
+        with self._lock:
+            stats = self._stats.get(kind)
+            if stats is None or len(stats.samples) < self.min_samples or stats.consecutive_timeouts:
+                return default
+            p95 = stats.percentile(0.95)
+        return min(default, max(floor, p95 * self.headroom))
+
+    def poll_interval_ms(self, kind: str, default: int = 250) -> int:
+        """Fallback poll tick for in-page waits: about a quarter of the typical latency."""
+        with self._lock:
+            stats = self._stats.get(kind)
+            ewma = stats.ewma if stats is not None else None
+        if ewma is None:
+            return default
+        return int(min(default, max(50, ewma * 1000 / 4)))
+
+    def summary(self) -> str:
+        """One entry per wait type, joined with "; " into a single line for debug output."""
+        with self._lock:
+            entries = []
+            for kind, stats in sorted(self._stats.items()):
+                p95 = stats.percentile(0.95)
+                entries.append(
+                    f"{kind}: ewma={stats.ewma or 0:.2f}s p95={p95 or 0:.2f}s "
+                    f"n={stats.count} timeouts={stats.timeouts}"
+                )
+        return "; ".join(entries)
+
+
+_tracker: Optional[LatencyTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get the shared latency tracker, loading saved stats on first use."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = LatencyTracker()
+            _tracker.load()
+            atexit.register(_tracker.save)
+        return _tracker
@@ -0,0 +1,80 @@
+"""
+Process memory helpers.
+
+Chrome spreads its memory over a browser process and many renderer, GPU and
+utility children, so the interesting number is the RSS of the whole tree.
+psutil is used when installed; otherwise /proc is read directly (Linux).
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PROC = Path("/proc")
+
+
+def _tree_rss_psutil(pid: int) -> Optional[int]:
+    try:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+def _tree_rss_proc(pid: int, proc: Path = PROC) -> Optional[int]:
+    if not proc.is_dir():
+        return None
+
+    children: dict[int, list[int]] = {}
+    for stat in proc.glob("[0-9]*/stat"):
+        try:
+            text = stat.read_text()
+            # The command name may contain spaces; ppid is the second field after it
+            ppid = int(text[text.rfind(")") + 2:].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(stat.parent.name))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    found = False
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            resident_pages = int((proc / str(current) / "statm").read_text().split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        found = True
+        total += resident_pages * page_size
+        stack.extend(children.get(current, ()))
+    return total if found else None
+
+
+def process_tree_rss(pid: Optional[int]) -> Optional[int]:
+    """
+    Resident memory of a process and all of its descendants.
+
+    Args:
+        pid: Root process id
+
+    Returns:
+        Bytes, or None if the process is gone or memory can't be read here
+    """
+    if not pid:
+        return None
+    if psutil is not None:
+        return _tree_rss_psutil(pid)
+    return _tree_rss_proc(pid)
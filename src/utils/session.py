@@ -5,11 +5,14 @@ Session management (FlareSolverr removed).
 import requests
 import time
 import threading
-from typing import Any
+from typing import Any, Iterable, Optional
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Cloudflare's challenge-passed cookie
+CLEARANCE_COOKIE = "cf_clearance"
+
 class SessionManager:
     """Manages requests session (FlareSolverr removed)."""
     
@@ -22,6 +25,40 @@ class SessionManager:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
         })
 
+    def apply_browser_state(self, cookies: Iterable[Any], user_agent: Optional[str] = None) -> None:
+        """
+        Adopt cookies and the User-Agent of a browser that passed Cloudflare.
+        
+        Clearance is bound to the User-Agent it was issued to, so both are
+        taken together.
+        
+        Args:
+            cookies: Objects with name, value, domain, path, expires and secure
+                attributes, such as CDP cookies
+            user_agent: The browser's navigator.userAgent
+        """
+        with self._lock:
+            if user_agent:
+                self.session.headers["User-Agent"] = user_agent
+            for c in cookies:
+                self.session.cookies.set_cookie(requests.cookies.create_cookie(
+                    name=c.name,
+                    value=c.value,
+                    domain=c.domain,
+                    path=c.path,
+                    expires=int(c.expires) if c.expires and c.expires > 0 else None,
+                    secure=c.secure,
+                ))
+
+    def has_clearance(self, margin: float = 60.0) -> bool:
+        """Whether the session holds a cf_clearance cookie valid for at least margin seconds."""
+        now = time.time()
+        with self._lock:
+            return any(
+                c.name == CLEARANCE_COOKIE and (c.expires is None or c.expires - margin > now)
+                for c in self.session.cookies
+            )
+
     def get(self, url: str, **kwargs: Any) -> requests.Response:
         """Execute a GET request directly."""
         # Pop force_flare if present
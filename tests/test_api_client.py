@@ -0,0 +1,113 @@
+import unittest
+from unittest import mock
+
+import requests
+
+from src.api.client import ApiUnavailable, ComixApiClient
+from src.utils.hash import generate_comix_hash
+
+
+def response(status=200, payload=None, headers=None, text=""):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    resp._content = (requests.compat.json.dumps(payload) if payload is not None else text).encode()
+    return resp
+
+
+class FakeSession:
+    def __init__(self, handler, clearance=False):
+        self.handler = handler
+        self.clearance = clearance
+        self.calls = []
+
+    def has_clearance(self):
+        return self.clearance
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append((url, params))
+        return self.handler(url, params)
+
+
+class ComixApiClientTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(setattr, ComixApiClient, "challenged", False)
+
+    def client(self, handler, clearance=False):
+        session = FakeSession(handler, clearance)
+        patcher = mock.patch("src.api.client.get_session", return_value=session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return ComixApiClient(), session
+
+    def test_paths_are_signed(self):
+        detail = {"id": 1, "hid": "93q1r", "title": "T", "url": "/title/93q1r-t"}
+        client, session = self.client(lambda url, params: response(payload={"result": detail}))
+
+        self.assertEqual(client.get_manga("93q1r"), detail)
+        url, params = session.calls[0]
+        self.assertEqual(url, "https://comix.to/api/v2/manga/93q1r")
+        self.assertEqual(params["_"], generate_comix_hash("/manga/93q1r"))
+
+    def test_chapter_pages_are_merged_by_id(self):
+        pages = {
+            1: [{"chapter_id": 3, "number": 3.0, "name": None, "scanlation_group": {"name": "G"}},
+                {"chapter_id": 2, "number": 2.5, "name": "Two", "is_official": True}],
+            2: [{"chapter_id": 2, "number": 2.5}, {"id": 1, "number": 1}],
+        }
+
+        def handler(url, params):
+            return response(payload={"result": {"items": pages[params["page"]], "pagination": {"last_page": 2}}})
+
+        client, session = self.client(handler)
+        rows = client.get_chapter_rows("93q1r")
+
+        self.assertEqual(len(session.calls), 2)
+        self.assertEqual([r["chapter_id"] for r in rows], [3, 2, 1])
+        self.assertEqual(rows[0], {"chapter_id": 3, "number": "3", "title": "Chapter 3", "group_name": "G"})
+        self.assertEqual(rows[1]["group_name"], "Official")
+
+    def test_challenge_and_signature_errors_raise_api_unavailable(self):
+        challenge = response(403, headers={"cf-mitigated": "challenge"}, text="<html>Just a moment</html>")
+        for resp in (challenge, response(400, payload={"message": "invalid signature"}), response(text="<html>")):
+            client, _ = self.client(lambda url, params, resp=resp: resp)
+            with self.assertRaises(ApiUnavailable):
+                client.get_chapter_images(1)
+
+    def test_after_a_challenge_calls_wait_for_clearance(self):
+        challenge = response(403, headers={"cf-mitigated": "challenge"}, text="<html>Just a moment</html>")
+        client, session = self.client(lambda url, params: challenge)
+        for _ in range(2):
+            with self.assertRaises(ApiUnavailable):
+                client.get_chapter_images(1)
+        self.assertEqual(len(session.calls), 1)
+
+        images = response(payload={"result": {"images": ["https://cdn/1.webp"]}})
+        client, session = self.client(lambda url, params: images, clearance=True)
+
+        self.assertEqual(client.get_chapter_images(1), ["https://cdn/1.webp"])
+
+    def test_server_and_connection_errors_raise_api_unavailable(self):
+        def refused(url, params):
+            raise requests.ConnectionError("refused")
+
+        for handler in (lambda url, params: response(502, text="Bad gateway"), refused):
+            client, _ = self.client(handler)
+            with self.assertRaises(ApiUnavailable):
+                client.get_chapter_rows("93q1r")
+
+    def test_unknown_payload_shapes_raise_api_unavailable(self):
+        cases = [
+            ("get_manga", {"title": "T"}),
+            ("get_chapter_rows", []),
+            ("get_chapter_rows", {"items": []}),
+            ("get_chapter_rows", {"items": ["3"]}),
+        ]
+        for method, result in cases:
+            client, _ = self.client(lambda url, params, result=result: response(payload={"result": result}))
+            with self.subTest(method=method, result=result), self.assertRaises(ApiUnavailable):
+                getattr(client, method)("93q1r")
+
+
+if __name__ == "__main__":
+    unittest.main()
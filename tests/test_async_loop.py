@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import unittest
+
+from src.utils.async_loop import EventLoopThread
+
+
+class EventLoopThreadTests(unittest.TestCase):
+    def setUp(self):
+        self.loop_thread = EventLoopThread(name="test-loop")
+
+    def tearDown(self):
+        self.loop_thread.stop()
+
+    def test_run_reuses_one_loop_across_calls(self):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = self.loop_thread.run(current_loop())
+        second = self.loop_thread.run(current_loop())
+
+        self.assertIs(first, second)
+        self.assertIs(first, self.loop_thread.loop)
+
+    def test_run_coroutine_from_another_loop(self):
+        async def loop_thread_name():
+            return threading.current_thread().name
+
+        async def caller():
+            return await self.loop_thread.run_coroutine(loop_thread_name())
+
+        self.assertEqual(asyncio.run(caller()), "test-loop")
+
+    def test_run_coroutine_inside_loop_awaits_directly(self):
+        async def inner():
+            return 42
+
+        async def outer():
+            return await self.loop_thread.run_coroutine(inner())
+
+        self.assertEqual(self.loop_thread.run(outer()), 42)
+
+    def test_run_from_loop_thread_raises(self):
+        async def nested():
+            coro = asyncio.sleep(0)
+            try:
+                self.loop_thread.run(coro)
+            finally:
+                coro.close()
+
+        with self.assertRaises(RuntimeError):
+            self.loop_thread.run(nested())
+
+    def test_iterate_hands_items_over_before_generator_finishes(self):
+        release = threading.Event()
+
+        async def pages():
+            yield 1
+            # Only continues once the consumer has seen the first item
+            await asyncio.get_running_loop().run_in_executor(None, release.wait, 5)
+            yield 2
+
+        items = self.loop_thread.iterate(pages())
+        self.assertEqual(next(items), 1)
+        release.set()
+        self.assertEqual(list(items), [2])
+
+    def test_iterate_reraises_generator_errors(self):
+        async def failing():
+            yield 1
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            list(self.loop_thread.iterate(failing()))
+
+
+if __name__ == "__main__":
+    unittest.main()
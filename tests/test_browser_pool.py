@@ -0,0 +1,194 @@
+import asyncio
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.api.browser import BrowserPool, TabHung, _PooledBrowser
+from src.utils.process import _tree_rss_proc
+
+
+class FakeTab:
+    def __init__(self):
+        self.hung = False
+        self.closed = False
+
+    async def send(self, cmd):
+        if self.hung:
+            await asyncio.sleep(3600)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.main_tab = FakeTab()
+        self.stopped = False
+
+    async def send(self, cmd):
+        pass
+
+    async def get(self, url, new_tab=False):
+        return FakeTab()
+
+    def stop(self):
+        self.stops = getattr(self, "stops", 0) + 1
+        self.stopped = True
+
+
+class FakeProcess:
+    def __init__(self, exits_after):
+        self.exits_after = exits_after
+        self.returncode = None
+
+    async def wait(self):
+        await asyncio.sleep(self.exits_after)
+        self.returncode = 0
+        return 0
+
+    def kill(self):
+        self.exits_after = 0
+
+
+class FakeProfile:
+    def __init__(self, process):
+        self.process = process
+        self.path = Path("slot-0")
+        self.released_after_exit = None
+
+    def release(self):
+        self.released_after_exit = self.process.returncode is not None
+
+
+class FakeCookieStore:
+    version = 0
+
+    async def inject(self, tab):
+        pass
+
+
+class BrowserPoolSupervisionTests(unittest.TestCase):
+    def setUp(self):
+        self.launched = []
+        patcher = mock.patch("src.api.browser.get_cookie_store", return_value=FakeCookieStore())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def pool(self, **kwargs):
+        pool = BrowserPool(**kwargs)
+
+        async def launch():
+            browser = FakeBrowser()
+            self.launched.append(browser)
+            entry = _PooledBrowser(browser)
+            entry.idle_tabs.append(browser.main_tab)
+            return entry
+
+        pool._launch = launch
+        return pool
+
+    def test_browser_is_recycled_after_max_uses(self):
+        pool = self.pool(max_browser_uses=3)
+
+        async def run():
+            for _ in range(4):
+                async with pool.tab():
+                    pass
+
+        asyncio.run(run())
+
+        self.assertEqual(len(self.launched), 2)
+        self.assertEqual(self.launched[0].stops, 1)
+        self.assertFalse(self.launched[1].stopped)
+
+    def test_affinity_returns_the_same_tab(self):
+        pool = self.pool(tabs_per_browser=2)
+
+        async def run():
+            async with pool.tab("lane-0") as first, pool.tab() as other:
+                pass
+            async with pool.tab() as unkeyed:
+                pass
+            async with pool.tab("lane-0") as again:
+                pass
+            return first, other, unkeyed, again
+
+        first, other, unkeyed, again = asyncio.run(run())
+
+        self.assertIs(again, first)
+        self.assertIs(unkeyed, other)
+
+    def test_hung_tab_is_replaced_and_work_requeued(self):
+        pool = self.pool(heartbeat_interval=0.01, heartbeat_timeout=0.05, health_check_timeout=0.05)
+        seen = []
+
+        async def work(tab):
+            seen.append(tab)
+            if len(seen) == 1:
+                tab.hung = True
+                await asyncio.sleep(3600)
+            return "done"
+
+        self.assertEqual(asyncio.run(pool.supervise(work)), "done")
+        self.assertEqual(len(seen), 2)
+        self.assertIsNot(seen[0], seen[1])
+        self.assertTrue(seen[0].closed)
+
+    def test_cancelled_supervise_cancels_the_work_before_the_tab_is_reused(self):
+        pool = self.pool()
+        running = asyncio.Event()
+        stopped = []
+
+        async def work(tab):
+            running.set()
+            try:
+                await asyncio.sleep(3600)
+            finally:
+                stopped.append(tab)
+
+        async def run():
+            task = asyncio.ensure_future(pool.supervise(work))
+            await running.wait()
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            async with pool.tab() as tab:
+                return tab, list(stopped)
+
+        reused, stopped_by_then = asyncio.run(run())
+
+        self.assertEqual(stopped_by_then, [reused])
+
+    def test_supervise_gives_up_after_attempts(self):
+        pool = self.pool(heartbeat_interval=0.01, heartbeat_timeout=0.05, health_check_timeout=0.05)
+
+        async def work(tab):
+            tab.hung = True
+            await asyncio.sleep(3600)
+
+        with self.assertRaises(TabHung):
+            asyncio.run(pool.supervise(work, attempts=2))
+
+    def test_profile_is_released_only_after_the_browser_exits(self):
+        browser = FakeBrowser()
+        browser._process = FakeProcess(exits_after=0.05)
+        profile = FakeProfile(browser._process)
+
+        asyncio.run(BrowserPool._stop(_PooledBrowser(browser, profile)))
+
+        self.assertTrue(browser.stopped)
+        self.assertTrue(profile.released_after_exit)
+
+
+@unittest.skipUnless(Path("/proc/self/statm").exists(), "needs /proc")
+class ProcessTreeRssTests(unittest.TestCase):
+    def test_reads_own_rss_from_proc(self):
+        rss = _tree_rss_proc(os.getpid())
+
+        self.assertIsNotNone(rss)
+        self.assertGreater(rss, 1024 * 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from src.api import comix
+from src.api.comix import ComixAPI
+
+
+def row(chapter_id):
+    return {"href": f"/title/abc-series/{chapter_id}-chapter-{chapter_id}", "title": None, "group": "G"}
+
+
+class FakePage:
+    def __init__(self, last_page, fetched):
+        self.url = "https://comix.to/title/abc-series"
+        self.last_page = last_page
+        self.fetched = fetched
+        self.fetched_urls = None
+
+    async def evaluate(self, expression, await_promise=False, return_by_value=True):
+        if expression == comix._LAST_LIST_PAGE_JS:
+            return self.last_page
+        self.fetched_urls = json.loads(expression.rsplit(")(", 1)[1].rsplit(",", 1)[0])
+        return json.dumps(self.fetched)
+
+
+class ScrapeChapterRowsTests(unittest.TestCase):
+    def scrape(self, page, tab_pages):
+        async def read_list_page(page, url, page_n, prev_first_href):
+            return tab_pages.get(page_n, [])
+
+        with mock.patch.object(ComixAPI, "_read_list_page", side_effect=read_list_page) as read:
+            rows = asyncio.run(ComixAPI._scrape_chapter_rows(page, page.url))
+        return rows, [c.args[2] for c in read.call_args_list]
+
+    def test_remaining_pages_are_fetched_together_and_merged_by_id(self):
+        page = FakePage(last_page=3, fetched=[[row(3), row(2)], [row(2), row(1)]])
+
+        rows, tab_reads = self.scrape(page, {1: [row(5), row(4), row(3)]})
+
+        self.assertEqual([r["chapter_id"] for r in rows], [5, 4, 3, 2, 1])
+        self.assertEqual(page.fetched_urls, [f"{page.url}?page=2", f"{page.url}?page=3"])
+        self.assertEqual(tab_reads, [1])
+
+    def test_unfetchable_pages_fall_back_to_the_tab(self):
+        page = FakePage(last_page=3, fetched=[None, [row(1)]])
+
+        rows, tab_reads = self.scrape(page, {1: [row(4), row(3)], 2: [row(2)]})
+
+        self.assertEqual([r["chapter_id"] for r in rows], [4, 3, 2, 1])
+        self.assertEqual(tab_reads, [1, 2])
+
+    def test_windowed_pagination_is_walked_past_the_last_link(self):
+        page = FakePage(last_page=3, fetched=[[row(4), row(3)], [row(2), row(1)]])
+
+        rows, tab_reads = self.scrape(page, {1: [row(6), row(5)], 4: [row(0)]})
+
+        self.assertEqual([r["chapter_id"] for r in rows], [6, 5, 4, 3, 2, 1, 0])
+        self.assertEqual(tab_reads, [1, 4, 5])
+
+    def test_missing_pagination_walks_pages_in_the_tab(self):
+        page = FakePage(last_page=None, fetched=[])
+
+        rows, tab_reads = self.scrape(page, {1: [row(3)], 2: [row(2)], 3: [row(2)], 4: [row(2)]})
+
+        self.assertEqual([r["chapter_id"] for r in rows], [3, 2])
+        self.assertEqual(tab_reads, [1, 2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
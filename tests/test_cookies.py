@@ -0,0 +1,83 @@
+import asyncio
+import pickle
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.api.cookies import CookieStore
+from src.utils.nodriver_compat import load_cdp_module
+
+network = load_cdp_module("network")
+
+
+def cookie(name, value, expires):
+    return network.Cookie(
+        name=name, value=value, domain=".comix.to", path="/", size=len(name + value),
+        http_only=True, secure=True, session=False, priority=network.CookiePriority.MEDIUM,
+        source_scheme=network.CookieSourceScheme.SECURE, source_port=443, expires=expires,
+    )
+
+
+class FakeConnection:
+    def __init__(self, cookies=()):
+        self.cookies = list(cookies)
+        self.sent = []
+
+    async def send(self, command):
+        request = next(command)
+        self.sent.append(request)
+        if request["method"] == "Storage.getCookies":
+            try:
+                command.send({"cookies": [c.to_json() for c in self.cookies]})
+            except StopIteration as result:
+                return result.value
+
+
+class CookieStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "cf_cookies.dat"
+        self.now = time.time()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_load_drops_expired_cookies_and_tracks_clearance(self):
+        with open(self.path, "wb") as f:
+            pickle.dump([cookie("cf_clearance", "a", self.now + 3600), cookie("old", "b", self.now - 10)], f)
+
+        store = CookieStore(self.path)
+        store.load()
+
+        self.assertEqual([c.name for c in store.cookies], ["cf_clearance"])
+        self.assertAlmostEqual(store.clearance_expires(), self.now + 3600)
+
+    def test_update_from_saves_only_when_cookies_change(self):
+        store = CookieStore(self.path)
+        connection = FakeConnection([cookie("cf_clearance", "a", self.now + 3600)])
+
+        self.assertTrue(asyncio.run(store.update_from(connection)))
+        mtime = self.path.stat().st_mtime_ns
+        self.assertFalse(asyncio.run(store.update_from(connection)))
+        self.assertEqual(self.path.stat().st_mtime_ns, mtime)
+
+        connection.cookies = [cookie("cf_clearance", "b", self.now + 7200)]
+        self.assertTrue(asyncio.run(store.update_from(connection)))
+        self.assertEqual(store.version, 2)
+
+    def test_inject_sends_cookie_params(self):
+        store = CookieStore(self.path)
+        asyncio.run(store.update_from(FakeConnection([cookie("cf_clearance", "a", self.now + 3600)])))
+        connection = FakeConnection()
+
+        asyncio.run(store.inject(connection))
+
+        request = connection.sent[0]
+        self.assertEqual(request["method"], "Storage.setCookies")
+        self.assertEqual(request["params"]["cookies"][0]["name"], "cf_clearance")
+        self.assertNotIn("size", request["params"]["cookies"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import threading
+import unittest
+
+from src.core.downloader import ImageDownloader, plan_chapter_lanes
+from src.core.models import Chapter, DownloadConfig
+
+
+class DownloadStreamTests(unittest.TestCase):
+    def test_pages_download_while_the_stream_is_still_producing(self):
+        downloader = ImageDownloader(DownloadConfig(max_image_workers=2))
+        first_done = threading.Event()
+        original = downloader.download_image
+
+        def download_image(url, index):
+            result = original(url, index)
+            if index == 1:
+                first_done.set()
+            return result
+
+        downloader.download_image = download_image
+
+        def pages():
+            yield 1, b"one"
+            # The extractor is still busy; page 1 must not wait for it
+            self.assertTrue(first_done.wait(5))
+            yield 3, "data:image/png;base64,dGhyZWU="
+
+        progress = []
+        results = downloader.download_stream(pages(), on_progress=lambda done, total: progress.append((done, total)),
+                                             expected=lambda: 3)
+
+        self.assertEqual(results, [(1, b"one"), (3, b"three")])
+        self.assertEqual(progress[-1], (2, 3))
+
+
+class PlanChapterLanesTests(unittest.TestCase):
+    def test_lanes_are_contiguous_runs_in_reading_order(self):
+        chapters = [Chapter(chapter_id=i, number=n) for i, n in enumerate(["10", "2", "1", "3.5", "3", "extra", "4"])]
+
+        lanes = plan_chapter_lanes(chapters, 3)
+
+        self.assertEqual([[c.number for c in lane] for lane in lanes],
+                         [["1", "2", "3"], ["3.5", "4"], ["10", "extra"]])
+
+    def test_never_more_lanes_than_chapters(self):
+        lanes = plan_chapter_lanes([{"number": "1"}], 4, number=lambda c: c["number"])
+
+        self.assertEqual(lanes, [[{"number": "1"}]])
+
+
+if __name__ == "__main__":
+    unittest.main()
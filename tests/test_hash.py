@@ -0,0 +1,44 @@
+import unittest
+
+from src.utils.hash import ComixHash, generate_comix_hash
+
+# Outputs of the original per-byte implementation
+GOLDEN = [
+    ("/manga/93q1r", 0, 1,
+     "xQm9tJfLwGhz_0Eq8S_YAHYkwp-q1PLfm50W5QJnyd1NnNYpAjXjyCoAzoOLtm2k-z4x0lsaNRTntQ"),
+    ("/manga/93q1r/chapters", 0, 1,
+     "xQm9tJfLwGhz_0Eq8S_YAHYkwp-q1PLfm50W5QJnyd1NnNYpAjXjyCoAzoOLtm2k-z4xWS0NeDGz_rNrbqBjLLP1H9qi"),
+    ("/chapters/123456", 0, 1,
+     "xQm9tJfLwGhz_0Eq8S_YAHYkwp-q1PLfm50W5QJnyd1NnN4phTXmyP2d_pfwDq15-zrPXGi6NRTnuvMX1L4"),
+    ("/manga/abc def/ü", 12, 1700000000,
+     "xQm9tJfLwGhz_0Eq8S_YAHYkwp-q1PLfm50W5QJnyd1NnNYpAjXjyCoAzoOLpsESLzrMZJS9NRInjBUX-Cy_53LdngYuF8bkQ5EfeHbp6iU2"),
+    ("", 0, 0,
+     "xQm9tJfLwGhz_0Eq8S_YAHYkwp-q1PLfm50W5f9nyd0NnCspYDWsyMy_"),
+    ("/-", 1235, 1695753998,
+     "xQm9tJfLwGhz_0Eq8S_YAHYkwp-q1PLfm50W5QJnyd1NnNcpYDWsyMw4iFNjDm10-_pF2enqriDhsg"),
+    ("/bcx_b 0bc&&c1c&bx1b?b1by/&yx/zx0_xcb0é&-", 3814, 1946412080,
+     "xQm9tJfLwGhz_0Eq8S_YAHYkwp-q1PLfm50W5QJnyd1NnOIpAzUZyBKwzoMgQMESLzqigSi6ohDujCSnvwPifvW5aPOi5M7-AmdcfGCiQlY87hJINXi0K0PQwqhPJpjHWgESmSa0sPYyjv0gO7eCA7CPDN_yVxFV"),
+    ("/_/1z1c/ é-=/cx &z-yé&bc--_é=cc9écb/=/?_a=_zxéb0/y1??écz=?9y&9&_?1yczy11aéz9/ay&_-y b=????xé?b0c0=zx-bxayx_ac0?y9__éxxé=éé/cyx-9éz a0 _ya /c9 _z_1 -101?10 é_aa9é9", 1586, 1478675319,
+     "xQm9tJfLwGhz_0Eq8S_YAHYkwp-q1PLfm50W5QJnyd1NnI0pYDWPyMs4wnPEDq15LzrMgewKNfDhhPMX2aCj4V4LowajeBVIDKFNVxPou5BPchzsjWDp4Dpn1MDT7Lr_1FP_RXKTMfZoLj5qbnGB72SiMNfyzWAFcKF0y4BVCZgmayqfwOfGpW_gGgFX0OqozLG8NG-UMyo-3ejk6loQJDTBGer5KUrdYniuU_7Uu6Dql9h7UpTwpjL6yDkBtKVMOcP83nUlqxUhnOAbOxdvz60bizvVwWD8W_eClyNNGVK_LjPQPUmtJJQipetb1RjaH7hZHe0NFf9qDJZ0tBgrjEhQG6mPI2k3sX7QCm3LJyiQ-MgUIRJtIEeEWXtzxuYs6Kx80uNX6ywbx_GVFSDQgt3dMP32Jf2EGnJ0H-1thFo4RCX7iCJ8f23Mq_O3VOHDLd-QPILExNlq1II0BXTySgXQF5_snYXZwlnCB3Qg8__feFW_9osvZRfFYQ"),
+]
+
+
+class ComixHashTests(unittest.TestCase):
+    def test_matches_original_implementation(self):
+        for path, body_size, time, expected in GOLDEN:
+            with self.subTest(path=path[:20], length=len(path)):
+                self.assertEqual(ComixHash._compute_hash(path, body_size, time), expected)
+                self.assertEqual(generate_comix_hash(path, body_size, time), expected)
+
+    def test_rounds_accept_other_keys(self):
+        keys = [bytes(reversed(k)) for k in ComixHash.encoded_keys()]
+        data = b"/manga/93q1r:0:1"
+
+        out = ComixHash.round1(data, keys)
+
+        self.assertNotEqual(out, ComixHash.round1(data))
+        # The first seven output bytes alternate with the round's prefix key
+        self.assertEqual(bytes(out[0:14:2]), keys[2][:7])
+
+if __name__ == "__main__":
+    unittest.main()
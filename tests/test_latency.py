@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.utils.latency import LatencyTracker
+
+
+class LatencyTrackerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "latency_stats.json"
+        self.tracker = LatencyTracker(self.path, min_samples=5)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_default_until_enough_samples(self):
+        for _ in range(4):
+            self.tracker.record("page_render", 0.5)
+
+        self.assertEqual(self.tracker.deadline("page_render", 30.0, 5.0), 30.0)
+
+    def test_deadline_follows_p95_within_bounds(self):
+        for seconds in [1.0] * 19 + [3.0]:
+            self.tracker.record("page_render", seconds)
+
+        self.assertEqual(self.tracker.deadline("page_render", 30.0, 5.0), 9.0)
+        self.assertEqual(self.tracker.deadline("page_render", 6.0, 1.0), 6.0)
+        self.assertEqual(self.tracker.poll_interval_ms("page_render"), 250)
+
+    def test_timeout_restores_default_until_next_success(self):
+        for _ in range(10):
+            self.tracker.record("chapter_rows", 0.2)
+        self.tracker.record_timeout("chapter_rows")
+
+        self.assertEqual(self.tracker.deadline("chapter_rows", 4.0, 1.5), 4.0)
+        self.tracker.record("chapter_rows", 0.2)
+        self.assertEqual(self.tracker.deadline("chapter_rows", 4.0, 1.5), 1.5)
+
+    def test_stats_persist_across_runs(self):
+        for _ in range(6):
+            self.tracker.record("initial_data", 0.4)
+        self.tracker.save()
+
+        restored = LatencyTracker(self.path)
+        restored.load()
+
+        self.assertAlmostEqual(restored.deadline("initial_data", 10.0, 0.1), 1.2)
+        self.assertEqual(restored.poll_interval_ms("initial_data"), 100)
+        self.assertIn("initial_data: ewma=0.40s", restored.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from src.api.network import ResourceBlocker
+from src.utils.nodriver_compat import load_cdp_module
+
+
+class FakeTab:
+    def __init__(self):
+        self.sent = []
+        self.handlers = {}
+
+    async def send(self, command):
+        # cdp commands are generators yielding their JSON request
+        self.sent.append(next(command))
+
+    def add_handler(self, event, handler):
+        self.handlers[event] = handler
+
+    def remove_handler(self, event, handler):
+        self.handlers.pop(event, None)
+
+
+def paused(url):
+    request_id = load_cdp_module("fetch").RequestId("1")
+    return SimpleNamespace(request_id=request_id, request=SimpleNamespace(url=url))
+
+
+class ResourceBlockerTests(unittest.TestCase):
+    def setUp(self):
+        self.tab = FakeTab()
+        self.blocker = ResourceBlocker(
+            self.tab,
+            resource_types=["Font", "NotAType"],
+            url_patterns=["*ads.example*"],
+            allowed_patterns=["*ads.example/keep*"],
+        )
+
+    def test_start_pauses_only_blocked_types_and_patterns(self):
+        asyncio.run(self.blocker.start())
+
+        params = self.tab.sent[0]["params"]["patterns"]
+        self.assertEqual(params, [
+            {"urlPattern": "*", "resourceType": "Font"},
+            {"urlPattern": "*ads.example*"},
+        ])
+
+    def test_paused_requests_are_failed_unless_allowed(self):
+        async def resolve(url):
+            await self.blocker._resolve(paused(url))
+            return self.tab.sent[-1]["method"]
+
+        self.assertEqual(asyncio.run(resolve("https://ads.example/x.js")), "Fetch.failRequest")
+        self.assertEqual(asyncio.run(resolve("https://ads.example/keep.js")), "Fetch.continueRequest")
+        self.assertEqual(
+            asyncio.run(resolve("https://challenges.cloudflare.com/turnstile/v0/api.js")),
+            "Fetch.continueRequest",
+        )
+        self.assertEqual(self.blocker.blocked, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import base64
+import re
+import tempfile
+import unittest
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+import src.core  # noqa: F401  (import order: src.formats depends on src.core)
+from src.core.models import DownloadConfig, ImageEncoding, OutputFormat
+from src.formats.pdf import create_pdf_from_bytes
+
+
+def encode(mode: str, fmt: str) -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, (120, 160), "green").save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+class PdfFromBytesTests(unittest.TestCase):
+    def test_jpeg_pages_are_embedded_without_reencoding(self):
+        jpeg = encode("RGB", "JPEG")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = create_pdf_from_bytes([(1, jpeg)], Path(tmp) / "chapter.pdf")
+            pdf = pdf_path.read_bytes()
+
+        # reportlab wraps the untouched JPEG stream in ASCII85
+        stream = re.search(rb"DCTDecode \].*?stream\r?\n(.*?)~>", pdf, re.S).group(1)
+        self.assertEqual(base64.a85decode(re.sub(rb"\s", b"", stream)), jpeg)
+
+    def test_transparent_webp_pages_are_converted(self):
+        webp = encode("RGBA", "WEBP")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = create_pdf_from_bytes([(1, webp)], Path(tmp) / "chapter.pdf")
+            self.assertIn(b"DCTDecode", pdf_path.read_bytes())
+
+
+class ImageEncodingTests(unittest.TestCase):
+    def test_auto_follows_output_format(self):
+        self.assertEqual(DownloadConfig(output_format=OutputFormat.PDF).get_image_encoding(), ImageEncoding.JPEG)
+        self.assertEqual(DownloadConfig(output_format=OutputFormat.CBZ).get_image_encoding(), ImageEncoding.WEBP)
+
+    def test_explicit_encoding_wins(self):
+        config = DownloadConfig(output_format=OutputFormat.PDF, image_encoding=ImageEncoding.PNG)
+        self.assertEqual(config.get_image_encoding(), ImageEncoding.PNG)
+
+
+if __name__ == "__main__":
+    unittest.main()
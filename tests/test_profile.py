@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.api.profile import MB, ProfileStore
+
+
+class ProfileStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_running_browsers_get_separate_slots(self):
+        store = ProfileStore(self.root, max_slots=2)
+
+        first = store.acquire()
+        second = store.acquire()
+        self.assertEqual((first.index, second.index), (0, 1))
+        self.assertIsNone(store.acquire())
+
+        first.release()
+        again = store.acquire()
+        self.assertEqual(again.index, 0)
+        second.release()
+        again.release()
+
+    def test_stale_singleton_files_are_removed(self):
+        slot_dir = self.root / "slot-0"
+        slot_dir.mkdir()
+        (slot_dir / "SingletonLock").symlink_to("otherhost-12345")
+
+        slot = ProfileStore(self.root).acquire()
+
+        self.assertFalse(os.path.lexists(slot_dir / "SingletonLock"))
+        slot.release()
+
+    def test_prune_removes_oldest_cache_files_only(self):
+        slot_dir = self.root / "slot-0"
+        cache = slot_dir / "Default" / "Cache"
+        cache.mkdir(parents=True)
+        for i in range(4):
+            file = cache / f"entry{i}"
+            file.write_bytes(b"x" * MB)
+            os.utime(file, (1000 + i, 1000 + i))
+        (slot_dir / "Default" / "Preferences").write_bytes(b"x" * MB)
+
+        freed = ProfileStore(self.root, max_mb=4).prune(slot_dir)
+
+        self.assertEqual(freed, 2 * MB)
+        self.assertEqual(sorted(p.name for p in cache.iterdir()), ["entry2", "entry3"])
+        self.assertTrue((slot_dir / "Default" / "Preferences").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
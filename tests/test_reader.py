@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from src.api import comix
+from src.api.browser import TabHung
+from src.api.comix import ComixAPI
+
+
+class FakeCdpTab:
+    """Answers Runtime.evaluate with queued (value, errors) replies."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.params = []
+
+    async def send(self, cmd):
+        request = next(cmd)
+        self.params.append(request["params"])
+        value, errors = self.replies.pop(0)
+        return SimpleNamespace(value=value, object_id=None), errors
+
+
+class WaitForTests(unittest.TestCase):
+    def test_object_results_come_back_by_value(self):
+        tab = FakeCdpTab([({"pages": 12}, None)])
+
+        state = asyncio.run(comix._wait_for(tab, "{pages: 12}", 5))
+
+        self.assertEqual(state, {"pages": 12})
+        self.assertTrue(tab.params[0]["returnByValue"])
+        self.assertNotIn("serializationOptions", tab.params[0])
+
+    def test_page_exception_retries_and_timeout_is_none(self):
+        tab = FakeCdpTab([(None, SimpleNamespace(text="context destroyed")), (None, None)])
+
+        self.assertIsNone(asyncio.run(comix._wait_for(tab, "null", 5)))
+        self.assertEqual(len(tab.params), 2)
+
+
+class BatchedExtractionTests(unittest.TestCase):
+    def extract(self, run_extract_batch):
+        async def collect():
+            return [item async for item in ComixAPI._iter_pages_batched(object(), 3, "image/webp", 0.9)]
+
+        with mock.patch.object(ComixAPI, "_run_extract_batch", side_effect=run_extract_batch), \
+                mock.patch.object(comix, "_ensure_runtime", new=mock.AsyncMock()) as ensure:
+            return asyncio.run(collect()), ensure
+
+    def test_failed_batch_is_extracted_page_by_page(self):
+        calls = []
+
+        async def run_extract_batch(page, first, last, *args):
+            calls.append((first, last))
+            if first != last:
+                raise RuntimeError("Execution context was destroyed")
+            return [{"type": "img", "src": f"https://cdn/{first}.webp"}]
+
+        pages, ensure = self.extract(run_extract_batch)
+
+        self.assertEqual([n for n, _ in pages], [1, 2, 3])
+        self.assertEqual(calls, [(1, 3), (1, 1), (2, 2), (3, 3)])
+        ensure.assert_awaited_once()
+
+    def test_page_by_page_failure_ends_the_chapter(self):
+        async def run_extract_batch(page, first, last, *args):
+            raise RuntimeError("window.__comix is undefined")
+
+        with self.assertRaises(RuntimeError):
+            self.extract(run_extract_batch)
+
+
+class StreamChapterImagesTests(unittest.TestCase):
+    def test_failure_after_some_pages_is_raised(self):
+        async def stream(*args, **kwargs):
+            yield 1, b"one"
+            raise TabHung("Tab missed its 20s heartbeat")
+
+        async def no_api_images(chapter_id, config):
+            return None
+
+        with mock.patch.object(ComixAPI, "_chapter_images_from_api", side_effect=no_api_images), \
+                mock.patch.object(ComixAPI, "_stream_chapter_async", side_effect=stream):
+            pages = []
+            with self.assertRaises(TabHung):
+                for item in ComixAPI.stream_chapter_images(7, "abc-series", "1", headless=True):
+                    pages.append(item)
+
+        self.assertEqual(pages, [(1, b"one")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import time
+import unittest
+from types import SimpleNamespace
+
+from src.utils.session import SessionManager
+
+
+def cookie(name, value, expires):
+    return SimpleNamespace(name=name, value=value, domain=".comix.to", path="/", expires=expires, secure=True)
+
+
+class ApplyBrowserStateTests(unittest.TestCase):
+    def test_clearance_and_user_agent_are_adopted(self):
+        manager = SessionManager()
+        self.assertFalse(manager.has_clearance())
+
+        manager.apply_browser_state(
+            [cookie("cf_clearance", "token", time.time() + 3600), cookie("session", "x", -1)],
+            "Mozilla/5.0 HeadlessChrome/140.0.0.0",
+        )
+
+        self.assertTrue(manager.has_clearance())
+        self.assertEqual(manager.session.headers["User-Agent"], "Mozilla/5.0 HeadlessChrome/140.0.0.0")
+        self.assertEqual(manager.session.cookies.get("cf_clearance", domain=".comix.to"), "token")
+        self.assertEqual(manager.session.cookies.get("session", domain=".comix.to"), "x")
+
+    def test_expiring_clearance_is_not_counted(self):
+        manager = SessionManager()
+        manager.apply_browser_state([cookie("cf_clearance", "token", time.time() + 30)])
+
+        self.assertFalse(manager.has_clearance())
+
+
+if __name__ == "__main__":
+    unittest.main()